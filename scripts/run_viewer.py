@@ -2,21 +2,43 @@
 """Script to run the DAT viewer application."""
 
 import sys
-from PySide6.QtWidgets import QApplication
-from expenses.app.viewer import DatViewer
+from typing import List
 
+# Viewers opened inside an already running application, kept referenced until they are closed
+_embedded_viewers: List[object] = []
 
-def main() -> None:
-    """Main entry point for the DAT viewer application."""
-    app = QApplication(sys.argv)
 
-    # Get initial directory from command line argument or use current directory
-    initial_dir = sys.argv[1] if len(sys.argv) > 1 else "."
+def _initial_dir(argv: List[str]) -> str:
+    """Get initial directory from command line arguments or use current directory."""
+    return argv[1] if len(argv) > 1 else "."
 
-    viewer = DatViewer(initial_dir)
+
+def main() -> int:
+    """Main entry point for the DAT viewer application.
+
+    Returns the application's exit code. Inside an already running application the
+    viewer is only shown, as that application's event loop serves it, and 0 is returned.
+    """
+    # Qt is imported here so that importing this script stays cheap
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication
+    from expenses.app.viewer import DatViewer
+
+    # Qt only allows one application per process, so a running one is reused
+    app = QApplication.instance()
+    embedded = app is not None
+    if app is None:
+        app = QApplication(sys.argv)
+
+    viewer = DatViewer(_initial_dir(sys.argv))
     viewer.show()
-    sys.exit(app.exec())
+    if embedded:
+        viewer.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        _embedded_viewers.append(viewer)
+        viewer.destroyed.connect(lambda: _embedded_viewers.remove(viewer))
+        return 0
+    return app.exec()
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,21 +1,45 @@
 """Qt-based viewer for DAT files."""
 
-from pathlib import Path
-from typing import Optional
+import codecs
+import mmap
+import os
+from typing import Iterator, Optional
 
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QPushButton, QTextEdit, QFileDialog
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QPushButton
+
+# Amount of file bytes handed to the text widget per event loop iteration
+_CHUNK_SIZE = 256 * 1024
+
+
+def _iter_mapped_chunks(file_path: str, chunk_size: int) -> Iterator[str]:
+    """Yield the decoded contents of a file in chunks, read through a read-only memory map"""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with open(file_path, "rb") as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start in range(0, len(mm), chunk_size):
+                # The incremental decoder keeps multi-byte characters split across chunks intact
+                yield decoder.decode(mm[start : start + chunk_size])
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
 
 
 class DatViewer(QMainWindow):
     def __init__(self, initial_dir: str = ".") -> None:
         super().__init__()
         self.setWindowTitle("DAT File Viewer")
-        self.initial_dir = str(Path(initial_dir).resolve())
+        # abspath only joins with the cwd; resolving symlinks gives the file dialog nothing extra
+        self.initial_dir = os.path.abspath(initial_dir)
         self.setup_ui()
         self._content: Optional[str] = None
 
     def setup_ui(self) -> None:
         """Setup the basic UI components"""
+        from PySide6.QtWidgets import QPlainTextEdit
+
         # Create central widget and layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -26,8 +50,8 @@ class DatViewer(QMainWindow):
         self.open_button.clicked.connect(self._open_file_dialog)
         layout.addWidget(self.open_button)
 
-        # Create text display area
-        self.text_display = QTextEdit()
+        # Create text display area, plain text is laid out incrementally and copes with large files
+        self.text_display = QPlainTextEdit()
         self.text_display.setReadOnly(True)
         layout.addWidget(self.text_display)
 
@@ -36,6 +60,8 @@ class DatViewer(QMainWindow):
 
     def _open_file_dialog(self) -> None:
         """Open a file dialog to select a .dat file"""
+        from PySide6.QtWidgets import QFileDialog
+
         file_name, _ = QFileDialog.getOpenFileName(
             self, "Open DAT File", self.initial_dir, "DAT Files (*.dat);;All Files (*)"
         )
@@ -43,13 +69,26 @@ class DatViewer(QMainWindow):
             self.load_file(file_name)
 
     def load_file(self, file_path: str) -> None:
-        """Load and display the contents of a .dat file"""
+        """Load and display the contents of a .dat file, feeding it to the widget in chunks"""
+        from PySide6.QtGui import QTextCursor
+        from PySide6.QtWidgets import QApplication
+
+        # Avoid re-entering while events are processed between chunks
+        self.open_button.setEnabled(False)
         try:
-            content = Path(file_path).read_text()
-            self._content = content
-            self.text_display.setText(content)
+            self.text_display.clear()
+            cursor = QTextCursor(self.text_display.document())
+            parts = []
+            for chunk in _iter_mapped_chunks(file_path, _CHUNK_SIZE):
+                parts.append(chunk)
+                cursor.insertText(chunk)
+                # Let the window paint and stay responsive while the rest is loaded
+                QApplication.processEvents()
+            self._content = "".join(parts)
         except Exception as e:
-            self.text_display.setText(f"Error loading file: {str(e)}")
+            self.text_display.setPlainText(f"Error loading file: {str(e)}")
+        finally:
+            self.open_button.setEnabled(True)
 
     def get_content(self) -> Optional[str]:
         """Return the currently loaded file content"""
@@ -1,11 +1,15 @@
+import sys
 from enum import Enum
 from dataclasses import dataclass
-from datetime import datetime, date
-import argparse
+from datetime import date
+from functools import cache
+from typing import TYPE_CHECKING
 
-from src.expenses.input_manager import InputManager
-from src.expenses.models import Entry, EntryLine, EntryType, VALID_COUNTRY_CURRENCIES
-from src.expenses.persistence import EntryRepository
+if TYPE_CHECKING:
+    import argparse
+
+    from src.expenses.input_manager import InputManager
+    from src.expenses.persistence import EntryRepository
 
 
 class CommandType(Enum):
@@ -29,52 +33,98 @@ class CommandType(Enum):
             ValueError: If the command is invalid.
         """
         command = command.strip().lower()
-        if command in ["expense", "e"]:
-            return cls.ADD_EXPENSE
-        elif command in ["income", "i"]:
-            return cls.ADD_INCOME
-        elif command in ["quit", "q"]:
-            return cls.QUIT
-        raise ValueError(f"Invalid command: {command}")
+        try:
+            return _COMMAND_MAP[command]
+        except KeyError:
+            raise ValueError(f"Invalid command: {command}") from None
+
+
+# Menu banners, written to stdout in a single call each
+_MAIN_BANNER = (
+    "\nExpenses Manager CLI\n"
+    "Available commands:\n"
+    "  expense/e - Add a new expense\n"
+    "  income/i - Add a new income\n"
+    "  quit/q   - Exit the program\n\n"
+)
+_EXPENSE_BANNER = (
+    "\nAdding expense:\n"
+    "Format: YYYY/MM/DD category amount description\n"
+    "Example: 2024/03/15 food 1234 Lunch at restaurant\n\n"
+)
+_INCOME_BANNER = (
+    "\nAdding income:\n"
+    "Format: YYYY/MM/DD category amount description\n"
+    "Example: 2024/03/15 salary 5000 Monthly salary\n\n"
+)
+
+# Accepted command names and their shortcuts
+_COMMAND_MAP: dict[str, CommandType] = {
+    "expense": CommandType.ADD_EXPENSE,
+    "e": CommandType.ADD_EXPENSE,
+    "income": CommandType.ADD_INCOME,
+    "i": CommandType.ADD_INCOME,
+    "quit": CommandType.QUIT,
+    "q": CommandType.QUIT,
+}
+
+
+def _write(text: str) -> None:
+    """Write a block of text to stdout with a single write and flush."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+@cache
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the command line argument parser.
+
+    argparse is imported here so its cost is only paid when arguments are parsed.
+    The parser is built once and shared by every CLI instance.
+
+    Returns:
+        The configured argument parser.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Expenses Manager - A CLI tool for managing expenses and income")
+    parser.add_argument(
+        "--data-dir",
+        type=str,
+        default=".",
+        help="Directory where data files are stored (default: current directory)",
+    )
+    parser.add_argument(
+        "--interactive",
+        action="store_true",
+        help="Run in interactive mode (default: True)",
+    )
+    return parser
 
 
 @dataclass
 class CLI:
     """Command Line Interface for the expenses manager."""
 
-    input_manager: InputManager
-    repository: EntryRepository | None = None
-    parser: argparse.ArgumentParser | None = None
+    input_manager: "InputManager"
+    repository: "EntryRepository | None" = None
+    parser: "argparse.ArgumentParser | None" = None
 
     def __post_init__(self) -> None:
-        """Initialize repository if not provided and setup argument parser."""
+        """Initialize repository if not provided."""
         if self.repository is None:
+            from src.expenses.persistence import EntryRepository
+
             self.repository = EntryRepository(data_dir=".", country_code=self.input_manager.country)
 
-        if self.parser is None:
-            self.parser = argparse.ArgumentParser(
-                description="Expenses Manager - A CLI tool for managing expenses and income"
-            )
-            self.parser.add_argument(
-                "--data-dir",
-                type=str,
-                default=".",
-                help="Directory where data files are stored (default: current directory)",
-            )
-            self.parser.add_argument(
-                "--interactive",
-                action="store_true",
-                help="Run in interactive mode (default: True)",
-            )
-
-    def parse_args(self) -> argparse.Namespace:
+    def parse_args(self) -> "argparse.Namespace":
         """Parse command line arguments.
 
         Returns:
             Parsed command line arguments.
         """
         if self.parser is None:
-            raise RuntimeError("Parser not initialized")
+            self.parser = _build_parser()
         return self.parser.parse_args()
 
     def parse_command(self, command: str) -> CommandType:
@@ -103,10 +153,9 @@ class CLI:
         Raises:
             ValueError: If the date format is invalid
         """
-        try:
-            return datetime.strptime(date_str, "%Y/%m/%d").date()
-        except ValueError:
-            raise ValueError("Invalid date format. Use YYYY/MM/DD")
+        from src.expenses.models import parse_entry_date
+
+        return parse_entry_date(date_str)
 
     def _validate_amount(self, amount_str: str) -> int:
         """Validate and parse an amount string.
@@ -122,13 +171,11 @@ class CLI:
         """
         try:
             amount = int(amount_str)
-            if amount < 0:
-                raise ValueError("Amount must be greater than or equal to 0")
-            return amount
-        except ValueError as e:
-            if "invalid literal for int()" in str(e):
-                raise ValueError("Amount must be a valid number")
-            raise
+        except ValueError:
+            raise ValueError("Amount must be a valid number") from None
+        if amount < 0:
+            raise ValueError("Amount must be greater than or equal to 0")
+        return amount
 
     def handle_add_expense(
         self,
@@ -149,6 +196,8 @@ class CLI:
             ValueError: If any argument is invalid
             RuntimeError: If repository is not initialized
         """
+        from src.expenses.models import Entry, EntryLine, EntryType
+
         entry_date = self._validate_date(date_str)
         amount = self._validate_amount(amount_str)
 
@@ -159,7 +208,7 @@ class CLI:
             entry_date=entry_date,
             category=category,
             entry_type=EntryType.EXPENSE,
-            currency=VALID_COUNTRY_CURRENCIES[self.input_manager.country],
+            currency=self.input_manager.currency,
             lines=[EntryLine(amount=amount, description=description)],
         )
 
@@ -184,6 +233,8 @@ class CLI:
             ValueError: If any argument is invalid
             RuntimeError: If repository is not initialized
         """
+        from src.expenses.models import Entry, EntryLine, EntryType
+
         entry_date = self._validate_date(date_str)
         amount = self._validate_amount(amount_str)
 
@@ -194,7 +245,7 @@ class CLI:
             entry_date=entry_date,
             category=category,
             entry_type=EntryType.INCOME,
-            currency=VALID_COUNTRY_CURRENCIES[self.input_manager.country],
+            currency=self.input_manager.currency,
             lines=[EntryLine(amount=amount, description=description)],
         )
 
@@ -202,11 +253,9 @@ class CLI:
 
     def run(self) -> None:
         """Run the CLI in interactive mode."""
-        print("\nExpenses Manager CLI")
-        print("Available commands:")
-        print("  expense/e - Add a new expense")
-        print("  income/i - Add a new income")
-        print("  quit/q   - Exit the program\n")
+        from src.expenses.models import InvalidEntryError, InvalidEntryLineError
+
+        _write(_MAIN_BANNER)
 
         while True:
             try:
@@ -217,13 +266,11 @@ class CLI:
                     print("Goodbye!")
                     break
                 elif command_type == CommandType.ADD_EXPENSE:
-                    print("\nAdding expense:")
-                    print("Format: YYYY/MM/DD category amount description")
-                    print("Example: 2024/03/15 food 1234 Lunch at restaurant\n")
+                    _write(_EXPENSE_BANNER)
 
                     raw_input = input("Enter details > ")
-                    # Split by space, but rejoin the description parts
-                    parts = raw_input.split()
+                    # The description is whatever follows the first three fields
+                    parts = raw_input.strip().split(maxsplit=3)
                     if len(parts) < 4:
                         raise ValueError(
                             "Missing required fields. Please provide date, category, amount and description."
@@ -233,18 +280,16 @@ class CLI:
                         date_str=parts[0],
                         category=parts[1],
                         amount_str=parts[2],
-                        description=" ".join(parts[3:]),
+                        description=parts[3],
                     )
                     print("✓ Expense added successfully")
 
                 elif command_type == CommandType.ADD_INCOME:
-                    print("\nAdding income:")
-                    print("Format: YYYY/MM/DD category amount description")
-                    print("Example: 2024/03/15 salary 5000 Monthly salary\n")
+                    _write(_INCOME_BANNER)
 
                     raw_input = input("Enter details > ")
-                    # Split by space, but rejoin the description parts
-                    parts = raw_input.split()
+                    # The description is whatever follows the first three fields
+                    parts = raw_input.strip().split(maxsplit=3)
                     if len(parts) < 4:
                         raise ValueError(
                             "Missing required fields. Please provide date, category, amount and description."
@@ -254,11 +299,11 @@ class CLI:
                         date_str=parts[0],
                         category=parts[1],
                         amount_str=parts[2],
-                        description=" ".join(parts[3:]),
+                        description=parts[3],
                     )
                     print("✓ Income added successfully")
 
-            except ValueError as e:
+            except (ValueError, InvalidEntryError, InvalidEntryLineError) as e:
                 print(f"\n❌ Error: {e}")
                 print("Please try again with the correct format\n")
             except KeyboardInterrupt:
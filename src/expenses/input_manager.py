@@ -1,23 +1,29 @@
+from .models import VALID_COUNTRY_CURRENCIES
+
+
 class InputManager:
     """Manages user input for the expenses CLI."""
 
     def __init__(self) -> None:
         """Initialize InputManager."""
         self.country: str = "se"  # Default to Sweden
+        self.currency: str = VALID_COUNTRY_CURRENCIES[self.country]
 
     def set_country(self) -> None:
         """Set the country for expense tracking.
 
         Prompts user for country code (es/se) and validates input.
-        Default is 'se' if no input provided.
+        Default is 'se' if no input provided. The currency is resolved from the
+        country table at the same time.
         """
         while True:
-            country = input("Enter country (es/se) [se]: ").lower().strip()
+            country = input("Enter country (es/se) [se]: ").strip().lower()
             if not country:
                 country = "se"
 
-            if country in ["es", "se"]:
+            if country in VALID_COUNTRY_CURRENCIES:
                 self.country = country
+                self.currency = VALID_COUNTRY_CURRENCIES[country]
                 break
 
             print("Invalid country. Please enter 'es' for Spain or 'se' for Sweden.")
@@ -1,3 +1,4 @@
+import sys
 from datetime import datetime
 
 from src.expenses.cli import CLI, CommandType
@@ -71,9 +72,18 @@ class ExpensesManager:
                 print(f"Unexpected error: {e}")
 
 
-if __name__ == "__main__":
-    import sys
+def main(argv: list[str] | None = None) -> None:
+    """Run the expenses manager interactively.
 
-    data_dir = sys.argv[1] if len(sys.argv) > 1 else "."
+    Args:
+        argv: Command line arguments, program name first. Defaults to sys.argv.
+            The optional first argument is the data directory.
+    """
+    args = sys.argv if argv is None else argv
+    data_dir = args[1] if len(args) > 1 else "."
     manager = ExpensesManager(data_dir)
     manager.run_interactive()
+
+
+if __name__ == "__main__":
+    main()
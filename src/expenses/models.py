@@ -23,11 +23,35 @@ class EntryType(Enum):
     INCOME = auto()
 
 
-VALID_CURRENCIES = {"SEK", "EUR"}
+VALID_CURRENCIES = frozenset({"SEK", "EUR"})
 VALID_COUNTRY_CURRENCIES = {"se": "SEK", "es": "EUR"}
 
 
-@dataclass
+def parse_entry_date(date_str: str) -> date:
+    """Parse a YYYY/MM/DD date, as typed or found in entry headers.
+
+    Months and days may lack their leading zero. The fields are split out directly
+    instead of going through strptime.
+
+    Raises:
+        ValueError: If the date is malformed or does not exist
+    """
+    fields = date_str.split("/")
+    if (
+        len(fields) != 3
+        or len(fields[0]) != 4
+        or not 1 <= len(fields[1]) <= 2
+        or not 1 <= len(fields[2]) <= 2
+        or not "".join(fields).isdigit()
+    ):
+        raise ValueError("Invalid date format. Use YYYY/MM/DD")
+    try:
+        return date(int(fields[0]), int(fields[1]), int(fields[2]))
+    except ValueError:
+        raise ValueError("Invalid date format. Use YYYY/MM/DD") from None
+
+
+@dataclass(slots=True)
 class EntryLine:
     """Represents a single line in an expense/income entry.
 
@@ -47,14 +71,15 @@ class EntryLine:
         if not self.description:
             raise InvalidEntryLineError("Description cannot be empty")
 
-        if " " in self.description:
+        # Any whitespace, tabs included, would split the description when the entry is read back
+        if self.description.split() != [self.description]:
             raise InvalidEntryLineError("Description cannot contain spaces, use colons (:) to separate words")
 
         if not isinstance(self.comments, list) or not all(isinstance(comment, str) for comment in self.comments):
             raise InvalidEntryLineError("Comments must be a list of strings")
 
 
-@dataclass
+@dataclass(slots=True)
 class Entry:
     """Represents an expense or income entry.
 
@@ -79,8 +104,8 @@ class Entry:
 
         # For income entries, all lines must have the same description
         if self.entry_type == EntryType.INCOME:
-            descriptions = {line.description for line in self.lines}
-            if len(descriptions) > 1:
+            description = self.lines[0].description
+            if any(line.description != description for line in self.lines):
                 raise InvalidEntryError("Income entries must have same description for all lines")
 
         if not isinstance(self.comments, list) or not all(isinstance(comment, str) for comment in self.comments):
@@ -1,8 +1,116 @@
+import bisect
 import os
+import re
+import shutil
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from datetime import date
-from typing import List
-
-from .models import Entry, EntryLine, EntryType, VALID_COUNTRY_CURRENCIES
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .models import Entry, EntryLine, EntryType, VALID_COUNTRY_CURRENCIES, VALID_CURRENCIES, parse_entry_date
+
+# Entry line templates per currency, bound once with the currency already filled in
+# instead of being rebuilt for every line.
+# Expense descriptions are padded so the currency always starts at column 41,
+# income lines have exactly 22 spaces between "* Assets:Checking" and the currency.
+_CHECKING_ACCOUNT = "* Assets:Checking"
+_EXPENSE_LINES = {currency: ("  {:<39}" + currency + " {}").format for currency in VALID_CURRENCIES}
+_INCOME_LINES = {
+    currency: ("  " + _CHECKING_ACCOUNT + " " * 22 + currency + " {}").format for currency in VALID_CURRENCIES
+}
+_EXPENSE_FOOTER = "  " + _CHECKING_ACCOUNT
+
+# Country code for each currency, the inverse of VALID_COUNTRY_CURRENCIES
+_CURRENCY_COUNTRIES = {currency: country_code for country_code, currency in VALID_COUNTRY_CURRENCIES.items()}
+
+# Buffer size for whole file rewrites, large enough to hold most month files
+_WRITE_BUFFER_SIZE = 64 * 1024
+# Bytes read from the end of a month file to find the date of its last entry
+_TAIL_SIZE = 4096
+# Upper bound of threads writing month files in parallel when saving entries spanning several months
+_MAX_WRITE_WORKERS = 4
+
+# Parsed entry blocks remembered per repository before the cache is emptied
+_BLOCK_CACHE_SIZE = 4096
+# Month files whose entries are remembered per repository, least recently used first out
+_FILE_CACHE_SIZE = 12
+
+# Entries are separated by one or more blank (or whitespace only) lines
+_BLOCK_SEPARATOR = re.compile(r"\n\s*\n")
+# Amount line: optional checking account, description, currency and amount, the amount
+# being left for int() to validate so that every form it accepts is still read
+_LINE_RE = re.compile(r"\s*(\* Assets:Checking\s+)?(.*?)\s*(\S+)\s+(\S+)")
+
+
+def _entry_date(entry: Entry) -> date:
+    """Sort key ordering entries by date."""
+    return entry.entry_date
+
+
+# Immutable snapshot of a parsed entry, cached instead of the mutable Entry so every read
+# hands out fresh objects: (date, category, type, currency, ((amount, description, comments), ...), comments)
+_EntryFields = Tuple[date, str, EntryType, str, Tuple[Tuple[int, str, Tuple[str, ...]], ...], Tuple[str, ...]]
+
+
+def _entry_fields(entry: Entry) -> _EntryFields:
+    """Take an immutable snapshot of an entry."""
+    return (
+        entry.entry_date,
+        entry.category,
+        entry.entry_type,
+        entry.currency,
+        tuple((line.amount, line.description, tuple(line.comments)) for line in entry.lines),
+        tuple(entry.comments),
+    )
+
+
+def _entry_from_fields(fields: _EntryFields) -> Entry:
+    """Build a new entry from a snapshot taken by _entry_fields."""
+    entry_date, category, entry_type, currency, lines, comments = fields
+    return Entry(
+        entry_date=entry_date,
+        category=category,
+        entry_type=entry_type,
+        currency=currency,
+        lines=[
+            EntryLine(amount=amount, description=description, comments=list(line_comments))
+            for amount, description, line_comments in lines
+        ],
+        comments=list(comments),
+    )
+
+
+def _copy_entry(entry: Entry) -> Entry:
+    """Copy an entry down to its lines, so later changes to the original do not reach the copy."""
+    return _entry_from_fields(_entry_fields(entry))
+
+
+def _stat_key(stat: os.stat_result) -> Tuple[int, int, int, int]:
+    """Identify a version of a file by its inode, modification and change times, and size."""
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+
+
+def _separator_after(tail: bytes) -> bytes:
+    """Newlines needed after a file ending in tail so that an appended entry starts a new block.
+
+    Written entries always end with a blank line, but hand edited files may end with a
+    single newline or none at all.
+    """
+    tail = tail.rstrip(b" \t")
+    if tail.endswith(b"\n\n"):
+        return b""
+    if tail.endswith(b"\n"):
+        return b"\n"
+    return b"\n\n"
+
+
+@lru_cache(maxsize=128)
+def _filename_for(country_code: str, year: int, month: int) -> str:
+    """Build the .dat file name for a country and month, memoized as most saves hit the same month."""
+    return f"{country_code}-{year}-{month:02d}.dat"
 
 
 class EntryRepository:
@@ -12,172 +120,352 @@ class EntryRepository:
         """Initialize the repository with the data directory path."""
         self.data_dir = data_dir
         self.country_code = country_code.lower()
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
+        # The country never changes, so its currency is looked up once; None for unknown countries
+        self._expected_currency = VALID_COUNTRY_CURRENCIES.get(self.country_code)
+        os.makedirs(data_dir, exist_ok=True)
+        # data_dir never changes, so file paths are built by plain concatenation onto this prefix
+        self._data_dir_prefix = os.path.join(data_dir, "")
+        # Snapshots of parsed entry blocks, keyed by their lines and comments
+        self._block_cache: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], _EntryFields] = {}
+        # Snapshots of the entries of recently read or written files, with the file's stat key
+        self._file_cache: Dict[str, Tuple[Tuple[int, int, int, int], List[_EntryFields]]] = {}
+        # save_entries writes month files from several threads
+        self._file_cache_lock = threading.Lock()
+        # Write-back state for session(): entries per loaded file, and the files pending a write
+        self._session_depth = 0
+        self._loaded: Dict[str, List[Entry]] = {}
+        self._dirty: Set[str] = set()
 
     def get_filename_for_entry(self, entry: Entry) -> str:
         """Generate the base filename for an entry based on its date and currency."""
-        country_code = "se" if entry.currency == "SEK" else "es"
-        return f"{country_code}-{entry.entry_date.year}-{entry.entry_date.month:02d}.dat"
+        country_code = _CURRENCY_COUNTRIES.get(entry.currency)
+        if country_code is None:
+            raise ValueError(f"Currency {entry.currency} does not match any country code")
+        return _filename_for(country_code, entry.entry_date.year, entry.entry_date.month)
 
     def _get_filepath_for_entry(self, entry: Entry) -> str:
         """Get the full file path for an entry."""
-        return os.path.join(self.data_dir, self.get_filename_for_entry(entry))
+        return self._data_dir_prefix + self.get_filename_for_entry(entry)
 
     def format_entry(self, entry: Entry) -> str:
         """Format an entry for writing to file."""
-        lines = []
-
-        # Add entry comments
-        lines.extend(entry.comments)
-
-        lines.append(f"{entry.entry_date.strftime('%Y/%m/%d')} {entry.category}")
-
+        # Each line is preceded by its comments, if any
         if entry.entry_type == EntryType.EXPENSE:
-            for line in entry.lines:
-                # Add line comments if any
-                lines.extend(line.comments)
-                # Total width before currency should be exactly 39 characters
-                # This includes the 2 initial spaces and the description
-                padding_length = 39 - len(line.description)
-                lines.append(f"  {line.description}{' ' * padding_length}{entry.currency} {line.amount}")
-            lines.append("  * Assets:Checking")
+            expense_line = _EXPENSE_LINES[entry.currency]
+            body = "\n".join(
+                text for line in entry.lines for text in (*line.comments, expense_line(line.description, line.amount))
+            )
+            footer = _EXPENSE_FOOTER
         else:  # INCOME
-            for line in entry.lines:
-                # Add line comments if any
-                lines.extend(line.comments)
-                # Exactly 22 spaces between "* Assets:Checking" and currency
-                lines.append(f"  * Assets:Checking{' ' * 22}{entry.currency} {line.amount}")
-            lines.append(f"  {line.description}")
+            income_line = _INCOME_LINES[entry.currency]
+            body = "\n".join(text for line in entry.lines for text in (*line.comments, income_line(line.amount)))
+            footer = f"  {entry.lines[-1].description}"
+
+        comments = "".join(f"{comment}\n" for comment in entry.comments)
+        # Formatting the date fields directly is much cheaper than strftime
+        entry_date = entry.entry_date
+        header = f"{entry_date.year:04d}/{entry_date.month:02d}/{entry_date.day:02d} {entry.category}"
 
         # Ensure exactly two blank lines after each entry
-        return "\n".join(lines) + "\n\n"
+        return f"{comments}{header}\n{body}\n{footer}\n\n"
 
     def save_entry(self, entry: Entry) -> None:
         """Save an entry to its corresponding file, maintaining date order."""
-        filename = self.get_filename_for_entry(entry)
-        filepath = self._get_filepath_for_entry(entry)
-        country_code = filename[:2]
-        expected_currency = VALID_COUNTRY_CURRENCIES.get(country_code)
-        if not expected_currency or entry.currency != expected_currency:
-            raise ValueError(f"Currency {entry.currency} does not match country code {country_code}")
-
-        # Read existing entries if file exists
-        entries = []
-        if os.path.exists(filepath):
+        # The file name is derived from the currency's country, which also validates the currency
+        self._save_entry_to(self._get_filepath_for_entry(entry), entry)
+
+    def _save_entry_to(self, filepath: str, entry: Entry) -> None:
+        """Save an entry into the given file, merging it with a matching entry if there is one."""
+        if self._session_depth:
+            # Inside a session entries are kept in memory and written once by flush()
+            entries = self._loaded.get(filepath)
+            if entries is None:
+                try:
+                    entries = self.read_entries(filepath)
+                except FileNotFoundError:
+                    entries = []
+                self._loaded[filepath] = entries
+            self._insert_entry(entries, _copy_entry(entry))
+            self._dirty.add(filepath)
+            return
+
+        # Open the file directly instead of checking it exists first
+        try:
+            # Files are kept in date order, so an entry dated after the last one can neither merge
+            # nor conflict with existing entries, and is appended after only reading the file's end
+            last_entry_date, separator = self._read_tail(filepath)
+            if last_entry_date is not None and entry.entry_date > last_entry_date:
+                self._append_entry(entry, filepath, separator)
+                return
+
             entries = self.read_entries(filepath)
+        except FileNotFoundError:
+            # No existing entries
+            self._write_entries([entry], filepath)
+            return
 
-            # For income entries, check if there's already an entry for this date
-            if entry.entry_type == EntryType.INCOME:
-                existing_income_entries = [
-                    e
-                    for e in entries
-                    if e.entry_date == entry.entry_date
-                    and e.entry_type == EntryType.INCOME
-                    and e.category != entry.category  # Allow merging same category
-                ]
-                if existing_income_entries:
-                    raise ValueError("Cannot have multiple income entries for the same date")
-
-            # Check for entries that can be merged
-            for existing_entry in entries:
-                if (
-                    existing_entry.entry_date == entry.entry_date
-                    and existing_entry.category == entry.category
-                    and existing_entry.entry_type == entry.entry_type
-                    and existing_entry.currency == entry.currency
-                ):
-                    try:
-                        # Merge entries
-                        merged_entry = self.merge_entries(existing_entry, entry)
-                        # Remove old entry and add merged one
-                        entries.remove(existing_entry)
-                        entries.append(merged_entry)
-                        break
-                    except ValueError:
-                        # If merge fails (e.g. different descriptions for income), just add as new entry
-                        entries.append(entry)
-                        break
-            else:
-                # No matching entry found for merging
-                entries.append(entry)
+        if self._insert_entry(entries, entry):
+            # The entry sorts last, so it is appended instead of rewriting the whole file
+            self._append_entry(entry, filepath, separator)
         else:
-            # No existing entries
-            entries.append(entry)
+            # Entries are read in date order and kept sorted, so they can be written as they are
+            self._write_entries(entries, filepath)
+
+    def _insert_entry(self, entries: List[Entry], entry: Entry) -> bool:
+        """Merge or insert an entry into a date ordered list of entries.
+
+        Returns True if the entry was added unmerged as the new last entry.
+        """
+        # For income entries, check if there's already an entry for this date
+        if entry.entry_type == EntryType.INCOME:
+            existing_income_entries = [
+                e
+                for e in entries
+                if e.entry_date == entry.entry_date
+                and e.entry_type == EntryType.INCOME
+                and e.category != entry.category  # Allow merging same category
+            ]
+            if existing_income_entries:
+                raise ValueError("Cannot have multiple income entries for the same date")
+
+        # Check for entries that can be merged
+        for i, existing_entry in enumerate(entries):
+            if (
+                existing_entry.entry_date == entry.entry_date
+                and existing_entry.category == entry.category
+                and existing_entry.entry_type == entry.entry_type
+                and existing_entry.currency == entry.currency
+            ):
+                try:
+                    # Replace the old entry with the merged one in place
+                    entries[i] = self.merge_entries(existing_entry, entry)
+                except ValueError:
+                    # If merge fails (e.g. different descriptions for income), just add as new entry
+                    bisect.insort(entries, entry, key=_entry_date)
+                return False
 
-        # Sort and write all entries
-        sorted_entries = self._sort_entries(entries)
-        self._write_entries(sorted_entries, filepath)
+        # No matching entry found for merging
+        is_last = not entries or entry.entry_date >= entries[-1].entry_date
+        bisect.insort(entries, entry, key=_entry_date)
+        return is_last
 
     def save_entries(self, entries: List[Entry]) -> None:
-        """Save multiple entries to a file, ensuring date order."""
+        """Save multiple entries, writing each month's entries to its own file in date order."""
         if not entries:
             return
 
         # Validate entries
         self.validate_entries(entries)
 
-        # Sort entries and write
-        filepath = self._get_filepath_for_entry(entries[0])
-        sorted_entries = self._sort_entries(entries)
-        self._write_entries(sorted_entries, filepath)
-
-    def _write_entries(self, entries: List[Entry], filepath: str) -> None:
-        """Write entries to a file, overwriting existing content."""
-        content = []
+        # Group entries by the month file they belong to
+        groups: Dict[str, List[Entry]] = defaultdict(list)
         for entry in entries:
-            content.append(self.format_entry(entry))
-        with open(filepath, "w") as f:
-            f.write("".join(content))
+            groups[self._get_filepath_for_entry(entry)].append(entry)
 
-    def read_entries(self, filepath: str) -> List[Entry]:
-        """Read all entries from a file."""
-        entries: List[Entry] = []
-        current_entry_lines: List[str] = []
-        current_entry_comments: List[str] = []
-        current_line_comments: List[str] = []
-
-        with open(filepath) as f:
-            for line in f:
-                line = line.rstrip()
-
-                # Skip empty lines
-                if not line:
-                    if current_entry_lines:
-                        entries.append(
-                            self._parse_entry(current_entry_lines, current_entry_comments, current_line_comments)
-                        )
-                        current_entry_lines = []
-                        current_entry_comments = []
-                        current_line_comments = []
-                    continue
+        if self._session_depth:
+            for filepath, file_entries in groups.items():
+                self._loaded[filepath] = self._sort_entries([_copy_entry(entry) for entry in file_entries])
+                self._dirty.add(filepath)
+            return
 
-                # Collect comments
-                if line.lstrip().startswith(";"):
-                    # If we haven't started collecting entry lines yet, these are entry comments
-                    if not current_entry_lines:
-                        current_entry_comments.append(line)
-                    # Otherwise these are line comments for the next line
-                    else:
-                        current_line_comments.append(line)
-                    continue
+        if len(groups) == 1:
+            filepath, file_entries = groups.popitem()
+            self._write_entries(self._sort_entries(file_entries), filepath)
+            return
+
+        # Writing is I/O bound and releases the GIL, so several months are written concurrently
+        with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(groups))) as executor:
+            # Consume the results so write errors are raised here
+            list(executor.map(self._write_entries, map(self._sort_entries, groups.values()), groups.keys()))
+
+    @contextmanager
+    def session(self) -> Iterator["EntryRepository"]:
+        """Buffer saved entries in memory and write each changed file once when the session ends.
+
+        Each file is read at most once per session, turning a batch of saves into a single
+        read and write per month file. Files are not updated on disk until the session ends
+        or flush() is called, and saved entries are copied, so changing them afterwards does
+        not change what is written. A session left by an exception writes nothing, leaving
+        the files as they were unless flush() was called. Sessions can be nested, only the
+        outermost one flushes.
+        """
+        self._session_depth += 1
+        completed = False
+        try:
+            yield self
+            completed = True
+        finally:
+            self._session_depth -= 1
+            if not self._session_depth:
+                try:
+                    if completed:
+                        self.flush()
+                finally:
+                    # Changes that were not written, because the session or its flush failed, are
+                    # dropped with the session, so the next session starts from what is on disk
+                    self._loaded.clear()
+                    self._dirty.clear()
+
+    def flush(self) -> None:
+        """Write every file changed since the last flush.
+
+        A file stays pending until it has been written, so a failed flush can be retried.
+        """
+        while self._dirty:
+            filepath = next(iter(self._dirty))
+            self._write_entries(self._loaded[filepath], filepath)
+            self._dirty.discard(filepath)
+
+    def _append_entry(self, entry: Entry, filepath: str, separator: bytes) -> None:
+        """Append an entry at the end of an existing file.
+
+        The separator (from _read_tail) completes the blank line the file should end with,
+        so the entry is not read back as part of the previous one.
+        """
+        with open(filepath, "ab") as f:
+            cached = self._cached_file(filepath, os.fstat(f.fileno()))
+            f.write(separator + self.format_entry(entry).encode("utf-8"))
+        if cached is None:
+            self._forget_file(filepath)
+        else:
+            self._remember_file(filepath, cached + [_entry_fields(entry)])
+
+    def _read_tail(self, filepath: str) -> Tuple[Optional[date], bytes]:
+        """Read the end of a file to find the date of its last entry and how it ends.
+
+        Returns the last entry date, or None if the file has no entries, or if the last
+        entry starts before the inspected tail or can't be parsed, leaving it to a full
+        read to deal with. Also returns the separator an appended entry must be preceded by.
+        """
+        with open(filepath, "rb") as f:
+            try:
+                f.seek(-_TAIL_SIZE, os.SEEK_END)
+                whole_file = False
+            except OSError:
+                # The file is smaller than the tail
+                f.seek(0)
+                whole_file = True
+            tail = f.read()
+
+        # An empty (or blank) file needs no separator before its first entry
+        separator = b"" if whole_file and not tail.strip() else _separator_after(tail)
+        lines = tail.split(b"\n")
+
+        # Unless the whole file was read, the first line may have been cut
+        if not whole_file:
+            lines = lines[1:]
+
+        # Headers are the only lines starting with the entry date, everything else is indented or a comment
+        for line in reversed(lines):
+            if line[:1].isdigit():
+                # A header the full parser would reject is left to it
+                header = line.split(b" ", 1)
+                if len(header) != 2:
+                    return None, separator
+                try:
+                    return parse_entry_date(header[0].decode("ascii")), separator
+                except ValueError:
+                    return None, separator
+        return None, separator
 
-                # If we have line comments and this is a new line, attach them to the previous line
-                if current_line_comments and current_entry_lines:
-                    # Insert comments before the last line
-                    insert_pos = len(current_entry_lines) - 1
-                    current_entry_lines[insert_pos:insert_pos] = current_line_comments
-                    current_line_comments = []
+    def _write_entries(self, entries: List[Entry], filepath: str) -> None:
+        """Write entries to a file, overwriting existing content.
+
+        Entries are streamed into a temporary file that then replaces the original,
+        so an interrupted write never leaves a truncated month file behind. A failed
+        write removes the temporary file before the error is raised again.
+        The replaced file keeps its permissions, and a symlinked file is rewritten
+        where the link points instead of the link being replaced.
+        """
+        target_filepath = os.path.realpath(filepath)
+        tmp_filepath = target_filepath + ".tmp"
+        try:
+            with open(tmp_filepath, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                for entry in entries:
+                    f.write(self.format_entry(entry).encode("utf-8"))
+            with suppress(FileNotFoundError):
+                shutil.copymode(target_filepath, tmp_filepath)
+            os.replace(tmp_filepath, target_filepath)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp_filepath)
+            self._forget_file(filepath)
+            raise
+        self._remember_file(filepath, [_entry_fields(entry) for entry in entries])
 
-                current_entry_lines.append(line)
+    def read_entries(self, filepath: str) -> List[Entry]:
+        """Read all entries from a file, as new objects even when the file is unchanged since the last read."""
+        with open(filepath, "rb") as f:
+            stat = os.fstat(f.fileno())
+            cached = self._cached_file(filepath, stat)
+            if cached is not None:
+                return [_entry_from_fields(fields) for fields in cached]
+            content = f.read().decode("utf-8")
+
+        entries = self._parse_content(content)
+        self._remember_file(filepath, [_entry_fields(entry) for entry in entries], stat)
+        return entries
 
-            # Handle last entry if file doesn't end with empty line
-            if current_entry_lines:
-                # Handle any remaining line comments
-                if current_line_comments:
-                    insert_pos = len(current_entry_lines) - 1
-                    current_entry_lines[insert_pos:insert_pos] = current_line_comments
-                entries.append(self._parse_entry(current_entry_lines, current_entry_comments, current_line_comments))
+    def _cached_file(self, filepath: str, stat: os.stat_result) -> Optional[List[_EntryFields]]:
+        """Return the remembered entries of a file if it is unchanged since they were remembered."""
+        key = _stat_key(stat)
+        with self._file_cache_lock:
+            cached = self._file_cache.pop(filepath, None)
+            if cached is None or cached[0] != key:
+                return None
+            # Re-inserting keeps the most recently used files last
+            self._file_cache[filepath] = cached
+            return cached[1]
+
+    def _remember_file(
+        self, filepath: str, fields: List[_EntryFields], stat: Optional[os.stat_result] = None
+    ) -> None:
+        """Remember the entries of a file as just read or written, so the next save need not read it."""
+        if stat is None:
+            stat = os.stat(filepath)
+        with self._file_cache_lock:
+            self._file_cache.pop(filepath, None)
+            if len(self._file_cache) >= _FILE_CACHE_SIZE:
+                del self._file_cache[next(iter(self._file_cache))]
+            self._file_cache[filepath] = (_stat_key(stat), fields)
+
+    def _forget_file(self, filepath: str) -> None:
+        """Drop the remembered entries of a file whose contents are no longer known."""
+        with self._file_cache_lock:
+            self._file_cache.pop(filepath, None)
+
+    def _parse_content(self, content: str) -> List[Entry]:
+        """Parse the content of a month file into entries.
+
+        The content is split into blank-line separated entry blocks instead of
+        being walked line by line.
+        """
+        entries: List[Entry] = []
+        # Comments in a block with no entry lines belong to the next entry
+        pending_comments: List[str] = []
+
+        for block in _BLOCK_SEPARATOR.split(content):
+            lines = [line.rstrip() for line in block.split("\n") if line.strip()]
+
+            # Comments before the header are entry comments
+            header_idx = 0
+            while header_idx < len(lines) and lines[header_idx].lstrip().startswith(";"):
+                header_idx += 1
+            pending_comments.extend(lines[:header_idx])
+            if header_idx == len(lines):
+                continue
+
+            block_key = (tuple(lines[header_idx:]), tuple(pending_comments))
+            pending_comments = []
+            fields = self._block_cache.get(block_key)
+            if fields is None:
+                entry = self._parse_entry(lines[header_idx:], list(block_key[1]), [])
+                if len(self._block_cache) >= _BLOCK_CACHE_SIZE:
+                    self._block_cache.clear()
+                self._block_cache[block_key] = _entry_fields(entry)
+            else:
+                entry = _entry_from_fields(fields)
+            entries.append(entry)
 
         return entries
 
@@ -213,107 +501,84 @@ class EntryRepository:
 
     def validate_entries(self, entries: List[Entry]) -> None:
         """Validate that all entries have the correct currency for the country code."""
-        expected_currency = VALID_COUNTRY_CURRENCIES.get(self.country_code)
+        expected_currency = self._expected_currency
         if not expected_currency:
             raise ValueError(f"Invalid country code: {self.country_code}")
 
-        for entry in entries:
-            if entry.currency != expected_currency:
-                raise ValueError(
-                    f"Invalid currency {entry.currency} for country {self.country_code}. Expected {expected_currency}"
-                )
+        # Check all currencies at once, only looking for the offending entry when there is one
+        if {entry.currency for entry in entries} - {expected_currency}:
+            currency = next(entry.currency for entry in entries if entry.currency != expected_currency)
+            raise ValueError(
+                f"Invalid currency {currency} for country {self.country_code}. Expected {expected_currency}"
+            )
 
     def _sort_entries(self, entries: List[Entry]) -> List[Entry]:
         """Sort entries by date in ascending order."""
-        return sorted(entries, key=lambda e: e.entry_date)
+        return sorted(entries, key=_entry_date)
 
     def _parse_entry(self, lines: List[str], entry_comments: List[str], line_comments: List[str]) -> Entry:
         """Parse an entry from its lines and comments."""
-        # First, extract and group line comments with their target lines
-        line_comment_groups: List[List[str]] = []
-        content_lines: List[str] = []
-        current_comments: List[str] = []
-
-        for line in lines:
-            if line.lstrip().startswith(";"):
-                current_comments.append(line)
-            else:
-                content_lines.append(line)
-                line_comment_groups.append(current_comments)
-                current_comments = []
-
-        if not content_lines:
+        # Locate the header and the footer (or income description), skipping comments around them
+        header_idx = 0
+        while header_idx < len(lines) and lines[header_idx].lstrip().startswith(";"):
+            header_idx += 1
+        footer_idx = len(lines) - 1
+        while footer_idx > header_idx and lines[footer_idx].lstrip().startswith(";"):
+            footer_idx -= 1
+
+        if header_idx == len(lines):
             raise ValueError("Empty entry")
 
         # Parse header
-        header = content_lines[0].split(" ", 1)
+        header = lines[header_idx].split(" ", 1)
         if len(header) != 2:
             raise ValueError("Invalid entry header")
 
-        entry_date = date.fromisoformat(header[0].replace("/", "-"))
+        entry_date = parse_entry_date(header[0])
         category = header[1]
 
         # Determine entry type and currency
-        is_expense = "* Assets:Checking" in content_lines[-1]
+        # The checking account always starts the (indented) footer line, so a prefix check is enough
+        is_expense = lines[footer_idx].lstrip().startswith(_CHECKING_ACCOUNT)
+        entry_type = EntryType.EXPENSE if is_expense else EntryType.INCOME
+        # Income entries carry their description on the last line
+        income_description = "" if is_expense else lines[footer_idx].strip()
         entry_lines = []
         entry_currency = None
 
-        if is_expense:
-            entry_type = EntryType.EXPENSE
-            # Parse expense lines (excluding header and footer)
-            line_idx = 0
-            for line in content_lines[1:-1]:
-                if "* Assets:Checking" in line:
-                    line_idx += 1
-                    continue
-                parts = line.strip().split()
-                if len(parts) < 3:
-                    line_idx += 1
-                    continue
-                try:
-                    currency = parts[-2]
-                    amount = int(parts[-1])
-                    description = " ".join(parts[:-2])
-                    entry_lines.append(
-                        EntryLine(
-                            amount=amount,
-                            description=description,
-                            comments=line_comment_groups[line_idx] if line_idx < len(line_comment_groups) else [],
-                        )
-                    )
-                    if entry_currency is None:
-                        entry_currency = currency
-                except ValueError:
-                    pass
-                line_idx += 1
-        else:
-            entry_type = EntryType.INCOME
-            # Parse income lines (excluding header and description)
-            description = content_lines[-1].strip()
-            line_idx = 0
-            for line in content_lines[1:-1]:
-                if not line.strip().startswith("* Assets:Checking"):
-                    line_idx += 1
-                    continue
-                parts = line.strip().split()
-                if len(parts) < 4:
-                    line_idx += 1
+        # Parse amount lines (excluding header and footer/description) in a single pass,
+        # collecting the comments that precede each of them
+        pending_comments: List[str] = []
+        for line in lines[header_idx + 1 : footer_idx]:
+            if line.lstrip().startswith(";"):
+                pending_comments.append(line)
+                continue
+            comments, pending_comments = pending_comments, []
+            match = _LINE_RE.fullmatch(line)
+            if match is None:
+                continue
+            description, currency, amount_str = match.group(2, 3, 4)
+            try:
+                amount = int(amount_str)
+            except ValueError:
+                continue
+            if is_expense:
+                # Expense lines need a description and never hit the checking account
+                if match[1] or not description:
                     continue
-                try:
-                    currency = parts[-2]
-                    amount = int(parts[-1])
-                    entry_lines.append(
-                        EntryLine(
-                            amount=amount,
-                            description=description,
-                            comments=line_comment_groups[line_idx] if line_idx < len(line_comment_groups) else [],
-                        )
-                    )
-                    if entry_currency is None:
-                        entry_currency = currency
-                except ValueError:
-                    pass
-                line_idx += 1
+            elif not match[1]:
+                continue
+            else:
+                description = income_description
+            entry_lines.append(
+                EntryLine(
+                    amount=amount,
+                    description=description,
+                    comments=comments,
+                )
+            )
+            if entry_currency is None:
+                entry_currency = currency
 
         if not entry_lines:
             raise ValueError("No valid entry lines found")
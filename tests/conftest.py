@@ -0,0 +1,24 @@
+from collections import deque
+from typing import Deque
+
+import pytest
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the markers used by the suite."""
+    config.addinivalue_line("markers", "e2e: end-to-end tests that run the interactive loop down to the data files")
+
+
+@pytest.fixture
+def input_queue(monkeypatch: pytest.MonkeyPatch) -> Deque[str]:
+    """Replace input() with a queue of answers, raising EOFError like a closed stdin once it runs out."""
+    answers: Deque[str] = deque()
+
+    def fake_input(prompt: str = "") -> str:
+        try:
+            return answers.popleft()
+        except IndexError:
+            raise EOFError from None
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    return answers
@@ -1,4 +1,5 @@
 from datetime import date
+from typing import Deque
 from unittest.mock import Mock
 import pytest
 
@@ -14,6 +15,7 @@ class TestCLI:
         """Create a mocked InputManager for testing."""
         manager = Mock(spec=InputManager)
         manager.country = "se"
+        manager.currency = "SEK"
         return manager
 
     @pytest.fixture
@@ -107,6 +109,51 @@ class TestCLI:
                 description="Food:Groceries",
             )
 
+    def test_add_expense_nonexistent_date(self, cli: CLI) -> None:
+        """Test that a well-formed but nonexistent date raises error."""
+        with pytest.raises(ValueError, match="Invalid date format. Use YYYY/MM/DD"):
+            cli.handle_add_expense(
+                date_str="2024/02/30",
+                category="Shopping",
+                amount_str="100",
+                description="Food:Groceries",
+            )
+
+    @pytest.mark.parametrize(
+        "date_str, expected_date",
+        [("2024/3/5", date(2024, 3, 5)), ("2024/03/5", date(2024, 3, 5)), ("2024/12/31", date(2024, 12, 31))],
+        ids=["unpadded", "unpadded-day", "padded"],
+    )
+    def test_add_expense_accepts_dates_without_zero_padding(
+        self, cli: CLI, mock_repository: Mock, date_str: str, expected_date: date
+    ) -> None:
+        """Test that months and days may be typed with or without a leading zero."""
+        # Arrange
+        cli.repository = mock_repository
+
+        # Act
+        cli.handle_add_expense(
+            date_str=date_str,
+            category="Shopping",
+            amount_str="100",
+            description="Food:Groceries",
+        )
+
+        # Assert
+        saved_entry = mock_repository.save_entry.call_args[0][0]
+        assert saved_entry.entry_date == expected_date
+
+    @pytest.mark.parametrize("date_str", ["24/03/21", "2024/003/21", "2024/03/", "2024/03/21/01", "2024x03x21"])
+    def test_add_expense_malformed_date(self, cli: CLI, date_str: str) -> None:
+        """Test that dates with a short year, overlong or missing fields, or other separators raise error."""
+        with pytest.raises(ValueError, match="Invalid date format. Use YYYY/MM/DD"):
+            cli.handle_add_expense(
+                date_str=date_str,
+                category="Shopping",
+                amount_str="100",
+                description="Food:Groceries",
+            )
+
     def test_add_expense_invalid_amount(self, cli: CLI) -> None:
         """Test that non-numeric amount raises error."""
         with pytest.raises(ValueError, match="Amount must be a valid number"):
@@ -292,3 +339,30 @@ class TestCLI:
         mock_repository.save_entry.assert_called_once()
         saved_entry = mock_repository.save_entry.call_args[0][0]
         assert saved_entry.category == "Monthly Salary"
+
+    @pytest.mark.parametrize("command", ["expense", "income"])
+    @pytest.mark.parametrize(
+        "description",
+        ["Food:Groceries\tDrinks", "Food:Groceries  Drinks", "Food:Groceries Drinks"],
+        ids=["tab", "double-space", "space"],
+    )
+    def test_run_rejects_whitespace_in_description(
+        self,
+        cli: CLI,
+        mock_repository: Mock,
+        input_queue: Deque[str],
+        capsys: pytest.CaptureFixture[str],
+        command: str,
+        description: str,
+    ) -> None:
+        """Test that a typed description containing any whitespace is rejected instead of saved."""
+        # Arrange
+        cli.repository = mock_repository
+        input_queue.extend([command, f"2024/03/21 Shopping 100 {description}"])
+
+        # Act
+        cli.run()
+
+        # Assert
+        mock_repository.save_entry.assert_not_called()
+        assert "Description cannot contain spaces" in capsys.readouterr().out
@@ -1,5 +1,4 @@
-from typing import Generator
-from unittest.mock import patch, Mock
+from typing import Deque
 import pytest
 
 from src.expenses.input_manager import InputManager
@@ -11,38 +10,27 @@ class TestInputManager:
         """Create a new InputManager instance for testing."""
         return InputManager()
 
-    @pytest.fixture
-    def mock_input(self) -> Generator[Mock, None, None]:
-        """Create a mock for the input function."""
-        with patch("builtins.input") as mock:
-            yield mock
-
-    def test_set_country_valid_inputs(self, input_manager: InputManager) -> None:
-        """Test country selection with valid inputs."""
-        # Test Spain selection
-        with patch("builtins.input", return_value="es"):
-            input_manager.set_country()
-            assert input_manager.country == "es"
-
-        # Test Sweden selection
-        with patch("builtins.input", return_value="se"):
-            input_manager.set_country()
-            assert input_manager.country == "se"
-
-    def test_set_country_default(self, input_manager: InputManager) -> None:
-        """Test country selection with empty input (should default to se)."""
-        with patch("builtins.input", return_value=""):
-            input_manager.set_country()
-            assert input_manager.country == "se"
-
-    def test_set_country_invalid_input(self, input_manager: InputManager, mock_input) -> None:
-        """Test country selection with invalid input."""
-        mock_input.side_effect = ["us", "se"]
-        input_manager.set_country()
-        assert input_manager.country == "se"
-
-    def test_set_country_whitespace_handling(self, input_manager: InputManager, mock_input) -> None:
-        """Test that whitespace is properly stripped from country input."""
-        mock_input.return_value = "  es  "
+    @pytest.mark.parametrize(
+        "inputs, expected_country, expected_currency",
+        [
+            (["es"], "es", "EUR"),
+            (["se"], "se", "SEK"),
+            ([""], "se", "SEK"),
+            (["us", "se"], "se", "SEK"),
+            (["  es  "], "es", "EUR"),
+        ],
+        ids=["spain", "sweden", "default", "invalid-then-valid", "surrounding-whitespace"],
+    )
+    def test_set_country(
+        self,
+        input_manager: InputManager,
+        input_queue: Deque[str],
+        inputs: list[str],
+        expected_country: str,
+        expected_currency: str,
+    ) -> None:
+        """Test country selection with valid, empty, invalid and whitespace padded inputs."""
+        input_queue.extend(inputs)
         input_manager.set_country()
-        assert input_manager.country == "es"
+        assert input_manager.country == expected_country
+        assert input_manager.currency == expected_currency
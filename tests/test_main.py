@@ -1,82 +1,134 @@
-import tempfile
-from unittest.mock import patch
+from datetime import date
+from pathlib import Path
+from typing import Deque
+from unittest.mock import Mock
 import pytest
 
-from src.expenses.main import ExpensesManager
+from src.expenses.main import ExpensesManager, main
+from src.expenses.models import EntryType
+from src.expenses.persistence import EntryRepository
+
+# Answers to the date, category, amount and description prompts of one entry
+_ENTRY_FIELDS = ("2024/03/21", "Shopping", "100", "Food:Groceries")
+_ENTRY_DATE = date(2024, 3, 21)
+_EXPENSE_ENTRY = ("expense",) + _ENTRY_FIELDS
+_QUIT = ("quit",)
+
+# Month file written for _EXPENSE_ENTRY in Sweden
+_EXPENSE_FILE_CONTENT = (
+    "2024/03/21 Shopping\n"
+    "  Food:Groceries                         SEK 100\n"
+    "  * Assets:Checking\n"
+    "\n"
+)
 
 
 class TestExpensesManager:
     @pytest.fixture
-    def manager(self) -> ExpensesManager:
+    def manager(self, input_queue: Deque[str], tmp_path: Path) -> ExpensesManager:
         """Create a new ExpensesManager instance for testing."""
-        with patch("builtins.input", return_value="se"):  # Mock country input
-            return ExpensesManager(data_dir=".")
+        input_queue.append("se")  # Country input
+        return ExpensesManager(data_dir=str(tmp_path))
+
+    @pytest.fixture
+    def mock_repository(self, manager: ExpensesManager) -> Mock:
+        """Replace the manager's repository with a mock so the input loop runs without file I/O."""
+        repository = Mock(spec=EntryRepository)
+        manager.cli.repository = repository
+        return repository
 
-    def test_initialization_with_data_dir(self) -> None:
+    def test_initialization_with_data_dir(self, input_queue: Deque[str], tmp_path: Path) -> None:
         """Test that ExpensesManager is initialized with correct data directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("builtins.input", return_value="se"):  # Mock country input
-                manager = ExpensesManager(data_dir=temp_dir)
-                assert manager.data_dir == temp_dir
+        input_queue.append("se")  # Country input
+        manager = ExpensesManager(data_dir=str(tmp_path))
+        assert manager.data_dir == str(tmp_path)
 
-    def test_initialization_defaults_to_current_dir(self) -> None:
+    def test_initialization_defaults_to_current_dir(self, input_queue: Deque[str]) -> None:
         """Test that ExpensesManager defaults to current directory."""
-        with patch("builtins.input", return_value="se"):  # Mock country input
-            manager = ExpensesManager()
-            assert manager.data_dir == "."
-
-    def test_run_interactive_expense_entry(self, manager: ExpensesManager) -> None:
-        """Test interactive expense entry."""
-        with patch("builtins.input") as mock_input:
-            mock_input.side_effect = [
-                "add-expense",  # command
-                "2024/03/21",  # date
-                "Shopping",  # category
-                "100",  # amount
-                "Food:Groceries",  # description
-                "quit",  # exit command
-            ]
-            manager.run_interactive()
-
-    def test_run_interactive_income_entry(self, manager: ExpensesManager) -> None:
-        """Test interactive income entry."""
-        with patch("builtins.input") as mock_input:
-            mock_input.side_effect = [
-                "add-income",  # command
-                "2024/03/21",  # date
-                "Salary",  # category
-                "1000,500",  # amounts
-                "Salary:Monthly",  # description
-                "quit",  # exit command
-            ]
-            manager.run_interactive()
+        input_queue.append("se")  # Country input
+        manager = ExpensesManager()
+        assert manager.data_dir == "."
+
+    @pytest.mark.e2e
+    def test_run_interactive_expense_entry(
+        self, manager: ExpensesManager, input_queue: Deque[str], tmp_path: Path
+    ) -> None:
+        """Test interactive expense entry end to end, down to the written file."""
+        input_queue.extend(_EXPENSE_ENTRY + _QUIT)
+        manager.run_interactive()
+
+        assert (tmp_path / "se-2024-03.dat").read_text() == _EXPENSE_FILE_CONTENT
+
+    @pytest.mark.parametrize(
+        "command, expected_type",
+        [
+            ("income", EntryType.INCOME),
+            ("i", EntryType.INCOME),
+            ("expense", EntryType.EXPENSE),
+            ("", EntryType.EXPENSE),
+        ],
+        ids=["income", "income-shortcut", "expense", "default-command"],
+    )
+    def test_run_interactive_saves_entry(
+        self,
+        manager: ExpensesManager,
+        mock_repository: Mock,
+        input_queue: Deque[str],
+        command: str,
+        expected_type: EntryType,
+    ) -> None:
+        """Test that each entry command saves one entry of its type, and that an empty command adds an expense."""
+        input_queue.extend((command,) + _ENTRY_FIELDS + _QUIT)
+        manager.run_interactive()
+
+        mock_repository.save_entry.assert_called_once()
+        saved_entry = mock_repository.save_entry.call_args[0][0]
+        assert saved_entry.entry_date == _ENTRY_DATE
+        assert saved_entry.entry_type == expected_type
+        assert saved_entry.lines[0].amount == 100
 
-    def test_run_interactive_with_invalid_inputs(self, manager: ExpensesManager) -> None:
+    def test_run_interactive_with_invalid_inputs(
+        self, manager: ExpensesManager, mock_repository: Mock, input_queue: Deque[str]
+    ) -> None:
         """Test that invalid inputs are handled gracefully."""
-        with patch("builtins.input") as mock_input:
-            mock_input.side_effect = [
+        input_queue.extend(
+            [
                 "invalid-command",  # invalid command
-                "add-expense",  # valid command
+                "expense",  # valid command
                 "invalid-date",  # invalid date
-                "2024/03/21",  # valid date
-                "Food Shopping",  # invalid category (spaces)
-                "Food:Shopping",  # valid category
-                "abc",  # invalid amount
-                "100",  # valid amount
-                "Food:Groceries",  # description
-                "quit",  # exit command
-            ]
-            manager.run_interactive()
-
-    def test_run_interactive_with_default_command(self, manager: ExpensesManager) -> None:
-        """Test that empty command defaults to expense."""
-        with patch("builtins.input") as mock_input:
-            mock_input.side_effect = [
-                "",  # empty command should default to expense
-                "2024/03/21",  # date
                 "Shopping",  # category
                 "100",  # amount
                 "Food:Groceries",  # description
+                "expense",  # valid command
+                "2024/03/21",  # valid date
+                "Shopping",  # category
+                "abc",  # invalid amount
+                "Food:Groceries",  # description
                 "quit",  # exit command
             ]
-            manager.run_interactive()
+        )
+        manager.run_interactive()
+
+        mock_repository.save_entry.assert_not_called()
+
+    def test_run_interactive_rejects_whitespace_in_description(
+        self,
+        manager: ExpensesManager,
+        mock_repository: Mock,
+        input_queue: Deque[str],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that a description with a tab inside is reported instead of saved."""
+        input_queue.extend(("expense", "2024/03/21", "Shopping", "100", "Food:\tGroceries") + _QUIT)
+        manager.run_interactive()
+
+        mock_repository.save_entry.assert_not_called()
+        assert "Description cannot contain spaces" in capsys.readouterr().out
+
+    @pytest.mark.e2e
+    def test_main_uses_data_dir_argument(self, input_queue: Deque[str], tmp_path: Path) -> None:
+        """Test that main() takes the data directory from its arguments instead of sys.argv."""
+        input_queue.extend(("se",) + _EXPENSE_ENTRY + _QUIT)
+        main(argv=["main.py", str(tmp_path)])
+
+        assert (tmp_path / "se-2024-03.dat").exists()
@@ -1,91 +1,69 @@
 from datetime import date
+from typing import Any
 import pytest
 
 from src.expenses.models import EntryLine, Entry, InvalidEntryLineError, InvalidEntryError, EntryType
 
+_ENTRY_DATE = date(2024, 3, 21)
 
-class TestEntryLine:
-    def test_valid_entry_line_creation(self) -> None:
-        """Test creating a valid entry line with correct format."""
-        # Arrange
-        amount = 100
-        description = "Shopping:Food"
 
+class TestEntryLine:
+    @pytest.mark.parametrize(
+        "amount, description, comments",
+        [
+            (100, "Shopping:Food", None),
+            (100, "Shopping:Food", ["; A simple comment"]),
+            (100, "Shopping:Food", ["; First comment", "  ; Indented comment", ";Last comment"]),
+            (100, "Shopping:Food:Groceries", None),
+            (0, "Test", None),
+        ],
+        ids=["no-comments", "single-comment", "multiple-comments", "multiple-colons", "zero-amount"],
+    )
+    def test_valid_entry_line_creation(self, amount: int, description: str, comments: list[str] | None) -> None:
+        """Test creating valid entry lines, with and without comments."""
         # Act
-        entry_line = EntryLine(amount=amount, description=description)
+        if comments is None:
+            entry_line = EntryLine(amount=amount, description=description)
+        else:
+            entry_line = EntryLine(amount=amount, description=description, comments=comments)
 
         # Assert
         assert entry_line.amount == amount
         assert entry_line.description == description
-        assert entry_line.comments == []
-
-    def test_entry_line_with_single_comment(self) -> None:
-        """Test creating an entry line with a single comment."""
-        # Arrange
-        amount = 100
-        description = "Shopping:Food"
-        comments = ["; A simple comment"]
-
-        # Act
-        entry_line = EntryLine(amount=amount, description=description, comments=comments)
-
-        # Assert
-        assert entry_line.comments == comments
-
-    def test_entry_line_with_multiple_comments(self) -> None:
-        """Test creating an entry line with multiple comments."""
-        # Arrange
-        amount = 100
-        description = "Shopping:Food"
-        comments = ["; First comment", "  ; Indented comment", ";Last comment"]
-
-        # Act
-        entry_line = EntryLine(amount=amount, description=description, comments=comments)
-
-        # Assert
-        assert entry_line.comments == comments
-
-    def test_entry_line_invalid_comments_type_raises_error(self) -> None:
-        """Test that invalid comments type raises an error."""
-        with pytest.raises(InvalidEntryLineError, match="Comments must be a list of strings"):
-            EntryLine(amount=100, description="Test", comments="not a list")  # type: ignore
-
-    def test_entry_line_invalid_comment_items_raises_error(self) -> None:
-        """Test that non-string comments raise an error."""
-        with pytest.raises(InvalidEntryLineError, match="Comments must be a list of strings"):
-            EntryLine(amount=100, description="Test", comments=["; valid", 42])  # type: ignore
-
-    def test_invalid_amount_raises_error(self) -> None:
-        """Test that negative amounts raise an error."""
-        with pytest.raises(InvalidEntryLineError, match="Amount must be greater than or equal to 0"):
-            EntryLine(amount=-100, description="Test")
-
-    def test_zero_amount_is_valid(self) -> None:
-        """Test that zero amount is valid."""
-        entry_line = EntryLine(amount=0, description="Test")
-        assert entry_line.amount == 0
-
-    def test_invalid_description_format_raises_error(self) -> None:
-        """Test that descriptions with spaces raise an error."""
-        with pytest.raises(InvalidEntryLineError, match="Description cannot contain spaces"):
-            EntryLine(amount=100, description="Test Description")
-
-    def test_empty_description_raises_error(self) -> None:
-        """Test that empty description raises an error."""
-        with pytest.raises(InvalidEntryLineError, match="Description cannot be empty"):
-            EntryLine(amount=100, description="")
-
-    def test_description_with_multiple_colons(self) -> None:
-        """Test that description can have multiple colon-separated parts."""
-        entry_line = EntryLine(amount=100, description="Shopping:Food:Groceries")
-        assert entry_line.description == "Shopping:Food:Groceries"
+        assert entry_line.comments == (comments or [])
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"amount": -100, "description": "Test"}, "Amount must be greater than or equal to 0"),
+            ({"amount": 100, "description": "Test Description"}, "Description cannot contain spaces"),
+            ({"amount": 100, "description": "Test\tDescription"}, "Description cannot contain spaces"),
+            ({"amount": 100, "description": "Test "}, "Description cannot contain spaces"),
+            ({"amount": 100, "description": ""}, "Description cannot be empty"),
+            ({"amount": 100, "description": "Test", "comments": "not a list"}, "Comments must be a list of strings"),
+            ({"amount": 100, "description": "Test", "comments": ["; valid", 42]}, "Comments must be a list of strings"),
+        ],
+        ids=[
+            "negative-amount",
+            "description-with-spaces",
+            "description-with-tab",
+            "description-with-trailing-space",
+            "empty-description",
+            "comments-not-a-list",
+            "non-string-comment",
+        ],
+    )
+    def test_invalid_entry_line_raises_error(self, kwargs: dict[str, Any], message: str) -> None:
+        """Test that invalid amounts, descriptions and comments raise an error."""
+        with pytest.raises(InvalidEntryLineError, match=message):
+            EntryLine(**kwargs)
 
 
 class TestEntry:
     def test_valid_expense_entry_creation(self) -> None:
         """Test creating a valid expense entry."""
         # Arrange
-        entry_date = date(2024, 3, 21)
+        entry_date = _ENTRY_DATE
         category = "Shopping"
         lines = [
             EntryLine(amount=100, description="Shopping:Food"),
@@ -108,7 +86,7 @@ class TestEntry:
     def test_valid_income_entry_creation(self) -> None:
         """Test creating a valid income entry with same descriptions."""
         # Arrange
-        entry_date = date(2024, 3, 21)
+        entry_date = _ENTRY_DATE
         category = "Salary"
         lines = [
             EntryLine(amount=1000, description="Salary:Monthly"),
@@ -127,40 +105,10 @@ class TestEntry:
         assert entry.currency == "EUR"
         assert entry.lines == lines
 
-    def test_income_entry_with_different_descriptions_raises_error(self) -> None:
-        """Test that income entries must have same description for all lines."""
-        with pytest.raises(InvalidEntryError, match="Income entries must have same description for all lines"):
-            Entry(
-                entry_date=date(2024, 3, 21),
-                category="Income",
-                entry_type=EntryType.INCOME,
-                currency="SEK",
-                lines=[
-                    EntryLine(amount=1000, description="Salary:Monthly"),
-                    EntryLine(amount=500, description="Bonus:Yearly"),
-                ],
-            )
-
-    def test_invalid_currency_raises_error(self) -> None:
-        """Test that only SEK and EUR are valid currencies."""
-        with pytest.raises(InvalidEntryError, match="Currency must be either SEK or EUR"):
-            Entry(
-                entry_date=date(2024, 3, 21),
-                category="Test",
-                entry_type=EntryType.EXPENSE,
-                currency="USD",
-                lines=[EntryLine(amount=100, description="Test")],
-            )
-
-    def test_empty_lines_raises_error(self) -> None:
-        """Test that entries must have at least one line."""
-        with pytest.raises(InvalidEntryError, match="Entry must have at least one line"):
-            Entry(entry_date=date(2024, 3, 21), category="Test", entry_type=EntryType.EXPENSE, currency="SEK", lines=[])
-
     def test_category_with_spaces_is_valid(self) -> None:
         """Test that categories can contain spaces."""
         # Arrange
-        entry_date = date(2024, 3, 21)
+        entry_date = _ENTRY_DATE
         category = "Food and Drinks"
         lines = [EntryLine(amount=100, description="Food:Groceries")]
 
@@ -175,7 +123,7 @@ class TestEntry:
     def test_entry_with_comments(self) -> None:
         """Test creating an entry with comments."""
         # Arrange
-        entry_date = date(2024, 3, 21)
+        entry_date = _ENTRY_DATE
         category = "Shopping"
         lines = [EntryLine(amount=100, description="Shopping:Food")]
         comments = ["; Entry comment", "  ; Another comment"]
@@ -196,7 +144,7 @@ class TestEntry:
     def test_entry_with_line_and_entry_comments(self) -> None:
         """Test creating an entry with both entry and line comments."""
         # Arrange
-        entry_date = date(2024, 3, 21)
+        entry_date = _ENTRY_DATE
         category = "Shopping"
         lines = [
             EntryLine(amount=100, description="Shopping:Food", comments=["; Line comment"]),
@@ -219,26 +167,41 @@ class TestEntry:
         assert entry.lines[0].comments == ["; Line comment"]
         assert entry.lines[1].comments == []
 
-    def test_entry_invalid_comments_type_raises_error(self) -> None:
-        """Test that invalid comments type raises an error."""
-        with pytest.raises(InvalidEntryError, match="Comments must be a list of strings"):
-            Entry(
-                entry_date=date(2024, 3, 21),
-                category="Test",
-                entry_type=EntryType.EXPENSE,
-                currency="SEK",
-                lines=[EntryLine(amount=100, description="Test")],
-                comments="not a list",  # type: ignore
-            )
-
-    def test_entry_invalid_comment_items_raises_error(self) -> None:
-        """Test that non-string comments raise an error."""
-        with pytest.raises(InvalidEntryError, match="Comments must be a list of strings"):
-            Entry(
-                entry_date=date(2024, 3, 21),
-                category="Test",
-                entry_type=EntryType.EXPENSE,
-                currency="SEK",
-                lines=[EntryLine(amount=100, description="Test")],
-                comments=["; valid", 42],  # type: ignore
-            )
+    @pytest.mark.parametrize(
+        "overrides, message",
+        [
+            (
+                {
+                    "entry_type": EntryType.INCOME,
+                    "lines": [
+                        EntryLine(amount=1000, description="Salary:Monthly"),
+                        EntryLine(amount=500, description="Bonus:Yearly"),
+                    ],
+                },
+                "Income entries must have same description for all lines",
+            ),
+            ({"currency": "USD"}, "Currency must be either SEK or EUR"),
+            ({"lines": []}, "Entry must have at least one line"),
+            ({"comments": "not a list"}, "Comments must be a list of strings"),
+            ({"comments": ["; valid", 42]}, "Comments must be a list of strings"),
+        ],
+        ids=[
+            "income-different-descriptions",
+            "invalid-currency",
+            "empty-lines",
+            "comments-not-a-list",
+            "non-string-comment",
+        ],
+    )
+    def test_invalid_entry_raises_error(self, overrides: dict[str, Any], message: str) -> None:
+        """Test that invalid lines, currencies and comments raise an error."""
+        kwargs: dict[str, Any] = {
+            "entry_date": _ENTRY_DATE,
+            "category": "Test",
+            "entry_type": EntryType.EXPENSE,
+            "currency": "SEK",
+            "lines": [EntryLine(amount=100, description="Test")],
+        }
+        kwargs.update(overrides)
+        with pytest.raises(InvalidEntryError, match=message):
+            Entry(**kwargs)
@@ -1,18 +1,40 @@
+from copy import copy
 from datetime import date
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 import pytest
-import os
+from pathlib import Path
 
 from src.expenses.models import Entry, EntryLine, EntryType
 from src.expenses.persistence import EntryRepository
 
+_ENTRY_DATE = date(2024, 3, 21)
+
+# Formatted expense_entry and income_entry fixtures
+_SHOPPING_EXPENSE = (
+    "2024/03/21 Shopping\n"
+    "  Shopping:Food                          SEK 100\n"
+    "  Shopping:Clothes                       SEK 200\n"
+    "  * Assets:Checking\n"
+    "\n"
+)
+_SALARY_INCOME = (
+    "2024/03/21 Salary\n"
+    "  * Assets:Checking                      EUR 1000\n"
+    "  * Assets:Checking                      EUR 500\n"
+    "  Salary:Monthly\n"
+    "\n"
+)
+# Single line entries already in a month file
+_EXISTING_SHOPPING = "2024/03/21 Shopping\n  Shopping:Food                          SEK 100\n  * Assets:Checking\n\n"
+_EXISTING_SALARY = "2024/03/21 Salary\n  * Assets:Checking                      EUR 1000\n  Salary:Monthly\n\n"
+
 
 class TestEntryRepository:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def expense_entry(self) -> Entry:
         """Create a sample expense entry for testing."""
         return Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Shopping",
             entry_type=EntryType.EXPENSE,
             currency="SEK",
@@ -22,11 +44,11 @@ class TestEntryRepository:
             ],
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def income_entry(self) -> Entry:
         """Create a sample income entry for testing."""
         return Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Salary",
             entry_type=EntryType.INCOME,
             currency="EUR",
@@ -50,14 +72,14 @@ class TestEntryRepository:
         """Test filename generation based on entry date and currency."""
         # Arrange
         entry_se = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Test",
             entry_type=EntryType.EXPENSE,
             currency="SEK",
             lines=[EntryLine(amount=100, description="Test:Entry")],
         )
         entry_es = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Test",
             entry_type=EntryType.EXPENSE,
             currency="EUR",
@@ -68,16 +90,22 @@ class TestEntryRepository:
         assert repository_se.get_filename_for_entry(entry_se) == "se-2024-03.dat"
         assert repository_es.get_filename_for_entry(entry_es) == "es-2024-03.dat"
 
+    def test_get_filename_for_entry_unknown_currency(
+        self, expense_entry: Entry, repository_se: EntryRepository
+    ) -> None:
+        """Test that an entry whose currency has no country cannot be given a file name."""
+        # Arrange
+        entry = copy(expense_entry)
+        entry.currency = "USD"
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Currency USD does not match any country code"):
+            repository_se.get_filename_for_entry(entry)
+
     def test_format_expense_entry(self, expense_entry: Entry, repository_se: EntryRepository) -> None:
         """Test formatting of expense entries."""
         # Arrange
-        expected_output = (
-            "2024/03/21 Shopping\n"
-            "  Shopping:Food                          SEK 100\n"
-            "  Shopping:Clothes                       SEK 200\n"
-            "  * Assets:Checking\n"
-            "\n"
-        )
+        expected_output = _SHOPPING_EXPENSE
 
         # Act
         result = repository_se.format_entry(expense_entry)
@@ -88,13 +116,7 @@ class TestEntryRepository:
     def test_format_income_entry(self, income_entry: Entry, repository_es: EntryRepository) -> None:
         """Test formatting of income entries."""
         # Arrange
-        expected_output = (
-            "2024/03/21 Salary\n"
-            "  * Assets:Checking                      EUR 1000\n"
-            "  * Assets:Checking                      EUR 500\n"
-            "  Salary:Monthly\n"
-            "\n"
-        )
+        expected_output = _SALARY_INCOME
 
         # Act
         result = repository_es.format_entry(income_entry)
@@ -102,23 +124,67 @@ class TestEntryRepository:
         # Assert
         assert result == expected_output
 
-    def test_save_entry_creates_file_if_not_exists(self, expense_entry: Entry, repository_se: EntryRepository) -> None:
+    def test_save_entry_creates_file_if_not_exists(self, expense_entry: Entry, tmp_path: Path) -> None:
         """Test that saving an entry creates a new file if it doesn't exist."""
         # Arrange
-        mock_file = mock_open()
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
 
         # Act
-        with patch("builtins.open", mock_file):
-            with patch("os.path.exists", return_value=False):
-                repository_se.save_entry(expense_entry)
+        repository.save_entry(expense_entry)
 
         # Assert
-        mock_file.assert_called_once_with(os.path.join(".", "se-2024-03.dat"), "w")
-        mock_file().write.assert_called_once_with(repository_se.format_entry(expense_entry))
+        assert (tmp_path / "se-2024-03.dat").read_text() == repository.format_entry(expense_entry)
+        assert [path.name for path in tmp_path.iterdir()] == ["se-2024-03.dat"]
 
-    def test_save_entry_maintains_order_with_existing_entries(
-        self, expense_entry: Entry, repository_se: EntryRepository
+    def test_write_entries_removes_temporary_file_on_failure(
+        self, expense_entry: Entry, repository_se: EntryRepository, tmp_path: Path
     ) -> None:
+        """Test that a failed rewrite leaves the original file untouched and no temporary file behind."""
+        # Arrange
+        filepath = tmp_path / "se-2024-03.dat"
+        filepath.write_text(_EXISTING_SHOPPING)
+
+        # Act
+        with patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                repository_se._write_entries([expense_entry], str(filepath))
+
+        # Assert
+        assert filepath.read_text() == _EXISTING_SHOPPING
+        assert [path.name for path in tmp_path.iterdir()] == ["se-2024-03.dat"]
+
+    def test_write_entries_keeps_file_permissions(self, expense_entry: Entry, tmp_path: Path) -> None:
+        """Test that rewriting a file keeps its permissions instead of those of a new file."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        filepath = tmp_path / "se-2024-03.dat"
+        filepath.write_text(_EXISTING_SHOPPING.replace("2024/03/21", "2024/03/25"))
+        filepath.chmod(0o600)
+
+        # Act
+        repository.save_entry(expense_entry)
+
+        # Assert
+        assert filepath.stat().st_mode & 0o777 == 0o600
+
+    def test_write_entries_rewrites_symlinked_file_in_place(self, expense_entry: Entry, tmp_path: Path) -> None:
+        """Test that rewriting a symlinked file updates the file it points to and keeps the link."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        target = tmp_path / "ledger.dat"
+        target.write_text(_EXISTING_SHOPPING.replace("2024/03/21", "2024/03/25"))
+        filepath = tmp_path / "se-2024-03.dat"
+        filepath.symlink_to(target)
+
+        # Act
+        repository.save_entry(expense_entry)
+
+        # Assert
+        assert filepath.is_symlink()
+        assert repository.format_entry(expense_entry) in target.read_text()
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["ledger.dat", "se-2024-03.dat"]
+
+    def test_save_entry_maintains_order_with_existing_entries(self, expense_entry: Entry, tmp_path: Path) -> None:
         """Test that saving an entry maintains date order with existing entries."""
         # Arrange
         existing_content = (
@@ -136,93 +202,59 @@ class TestEntryRepository:
             "  Shopping:Food                          SEK 100\n"
             "  * Assets:Checking\n"
             "\n"
-            "2024/03/21 Shopping\n"
-            "  Shopping:Food                          SEK 100\n"
-            "  Shopping:Clothes                       SEK 200\n"
-            "  * Assets:Checking\n"
-            "\n"
-            "2024/03/22 Shopping\n"
+            + _SHOPPING_EXPENSE
+            + "2024/03/22 Shopping\n"
             "  Shopping:Food                          SEK 100\n"
             "  * Assets:Checking\n"
             "\n"
         )
-        mock_file = mock_open(read_data=existing_content)
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        (tmp_path / "se-2024-03.dat").write_text(existing_content)
 
         # Act
-        with patch("builtins.open", mock_file):
-            with patch("os.path.exists", return_value=True):
-                repository_se.save_entry(expense_entry)
+        repository.save_entry(expense_entry)
 
         # Assert
-        written_content = "".join(mock_file().write.call_args_list[0][0])
-        assert written_content == expected_content
+        assert (tmp_path / "se-2024-03.dat").read_text() == expected_content
 
     def test_add_line_to_existing_expense_entry(self, repository_se: EntryRepository) -> None:
         """Test adding a new line to an existing expense entry."""
         # Arrange
-        existing_content = (
-            "2024/03/21 Shopping\n  Shopping:Food                          SEK 100\n  * Assets:Checking\n\n"
-        )
+        existing_content = _EXISTING_SHOPPING
         new_entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Shopping",
             entry_type=EntryType.EXPENSE,
             currency="SEK",
             lines=[EntryLine(amount=200, description="Shopping:Clothes")],
         )
-        expected_content = (
-            "2024/03/21 Shopping\n"
-            "  Shopping:Food                          SEK 100\n"
-            "  Shopping:Clothes                       SEK 200\n"
-            "  * Assets:Checking\n"
-            "\n"
-        )
-        mock_file = mock_open(read_data=existing_content)
+        expected_content = _SHOPPING_EXPENSE
 
-        # Act & Assert
-        with patch("builtins.open", mock_file):
-            with patch("os.path.exists", return_value=True):
-                # First read existing entries
-                entries = repository_se.read_entries("se-2024-03.dat")
-                # Merge entries
-                merged_entry = repository_se.merge_entries(entries[0], new_entry)
-                # Write back
-                repository_se.save_entry(merged_entry)
-
-        # Verify the merged entry format
+        # Act
+        entries = repository_se._parse_content(existing_content)
+        merged_entry = repository_se.merge_entries(entries[0], new_entry)
+
+        # Assert
         assert repository_se.format_entry(merged_entry) == expected_content
 
     def test_add_line_to_existing_income_entry(self, repository_es: EntryRepository) -> None:
         """Test adding a new line to an existing income entry with same description."""
         # Arrange
-        existing_content = "2024/03/21 Salary\n  * Assets:Checking                      EUR 1000\n  Salary:Monthly\n\n"
+        existing_content = _EXISTING_SALARY
         new_entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Salary",
             entry_type=EntryType.INCOME,
             currency="EUR",
             lines=[EntryLine(amount=500, description="Salary:Monthly")],
         )
-        expected_content = (
-            "2024/03/21 Salary\n"
-            "  * Assets:Checking                      EUR 1000\n"
-            "  * Assets:Checking                      EUR 500\n"
-            "  Salary:Monthly\n"
-            "\n"
-        )
-        mock_file = mock_open(read_data=existing_content)
+        expected_content = _SALARY_INCOME
 
-        # Act & Assert
-        with patch("builtins.open", mock_file):
-            with patch("os.path.exists", return_value=True):
-                # First read existing entries
-                entries = repository_es.read_entries("es-2024-03.dat")
-                # Merge entries
-                merged_entry = repository_es.merge_entries(entries[0], new_entry)
-                # Write back
-                repository_es.save_entry(merged_entry)
-
-        # Verify the merged entry format
+        # Act
+        entries = repository_es._parse_content(existing_content)
+        merged_entry = repository_es.merge_entries(entries[0], new_entry)
+
+        # Assert
         assert repository_es.format_entry(merged_entry) == expected_content
 
     def test_add_line_to_income_entry_with_different_description_raises_error(
@@ -231,14 +263,14 @@ class TestEntryRepository:
         """Test that adding a line with different description to income entry raises error."""
         # Arrange
         existing_entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Salary",
             entry_type=EntryType.INCOME,
             currency="EUR",
             lines=[EntryLine(amount=1000, description="Salary:Monthly")],
         )
         new_entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Salary",
             entry_type=EntryType.INCOME,
             currency="EUR",
@@ -249,65 +281,58 @@ class TestEntryRepository:
         with pytest.raises(ValueError, match="Cannot merge income entries with different descriptions"):
             repository_es.merge_entries(existing_entry, new_entry)
 
-    def test_multiple_expense_entries_same_date_different_categories(self, repository_se: EntryRepository) -> None:
+    def test_multiple_expense_entries_same_date_different_categories(self, tmp_path: Path) -> None:
         """Test that multiple expense entries with same date but different categories are allowed."""
         # Arrange
-        existing_content = (
-            "2024/03/21 Shopping\n  Shopping:Food                          SEK 100\n  * Assets:Checking\n\n"
-        )
+        existing_content = _EXISTING_SHOPPING
         new_entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Transport",
             entry_type=EntryType.EXPENSE,
             currency="SEK",
             lines=[EntryLine(amount=200, description="Transport:Bus")],
         )
         expected_content = (
-            "2024/03/21 Shopping\n"
-            "  Shopping:Food                          SEK 100\n"
-            "  * Assets:Checking\n"
-            "\n"
-            "2024/03/21 Transport\n"
+            _EXISTING_SHOPPING
+            + "2024/03/21 Transport\n"
             "  Transport:Bus                          SEK 200\n"
             "  * Assets:Checking\n"
             "\n"
         )
-        mock_file = mock_open(read_data=existing_content)
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        (tmp_path / "se-2024-03.dat").write_text(existing_content)
 
-        # Act & Assert
-        with patch("builtins.open", mock_file):
-            with patch("os.path.exists", return_value=True):
-                repository_se.save_entry(new_entry)
+        # Act
+        repository.save_entry(new_entry)
 
-        # Verify content
-        written_content = "".join(mock_file().write.call_args_list[0][0])
-        assert written_content == expected_content
+        # Assert
+        assert (tmp_path / "se-2024-03.dat").read_text() == expected_content
 
-    def test_multiple_income_entries_same_date_raises_error(self, repository_es: EntryRepository) -> None:
+    def test_multiple_income_entries_same_date_raises_error(self, tmp_path: Path) -> None:
         """Test that multiple income entries with same date raise error."""
         # Arrange
-        existing_content = "2024/03/21 Salary\n  * Assets:Checking                      EUR 1000\n  Salary:Monthly\n\n"
+        existing_content = _EXISTING_SALARY
         new_entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Bonus",
             entry_type=EntryType.INCOME,
             currency="EUR",
             lines=[EntryLine(amount=500, description="Salary:Bonus")],
         )
-        mock_file = mock_open(read_data=existing_content)
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="es")
+        (tmp_path / "es-2024-03.dat").write_text(existing_content)
 
         # Act & Assert
-        with patch("builtins.open", mock_file):
-            with patch("os.path.exists", return_value=True):
-                with pytest.raises(ValueError, match="Cannot have multiple income entries for the same date"):
-                    repository_es.save_entry(new_entry)
+        with pytest.raises(ValueError, match="Cannot have multiple income entries for the same date"):
+            repository.save_entry(new_entry)
+        assert (tmp_path / "es-2024-03.dat").read_text() == existing_content
 
     def test_currency_must_match_country_code(self) -> None:
         """Test that currency must match the country code."""
         # Arrange
         repository = EntryRepository(data_dir=".", country_code="se")
         entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Test",
             entry_type=EntryType.EXPENSE,
             currency="EUR",
@@ -318,18 +343,18 @@ class TestEntryRepository:
         with pytest.raises(ValueError, match="Invalid currency EUR for country se. Expected SEK"):
             repository.validate_entries([entry])
 
-    def test_save_entry_automatically_merges_matching_entries(self, repository_se: EntryRepository) -> None:
+    def test_save_entry_automatically_merges_matching_entries(self, tmp_path: Path) -> None:
         """Test that save_entry automatically merges entries with same date and category."""
         # Arrange
         first_entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Food",
             entry_type=EntryType.EXPENSE,
             currency="SEK",
             lines=[EntryLine(amount=100, description="Food:Lunch")],
         )
         second_entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Food",
             entry_type=EntryType.EXPENSE,
             currency="SEK",
@@ -342,21 +367,16 @@ class TestEntryRepository:
             "  * Assets:Checking\n"
             "\n"
         )
-        mock_file = mock_open()
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
 
         # Act
-        with patch("builtins.open", mock_file):
-            with patch("os.path.exists", return_value=True):
-                # Mock reading the first entry when saving the second
-                with patch.object(repository_se, "read_entries", return_value=[first_entry]):
-                    repository_se.save_entry(second_entry)
+        repository.save_entry(first_entry)
+        repository.save_entry(second_entry)
 
         # Assert
-        mock_file().write.assert_called_once()
-        written_content = "".join(mock_file().write.call_args_list[0][0])
-        assert written_content == expected_content
+        assert (tmp_path / "se-2024-03.dat").read_text() == expected_content
 
-    def test_read_entries_with_comments(self, repository_se: EntryRepository) -> None:
+    def test_read_entries_with_comments(self, repository_se: EntryRepository, tmp_path: Path) -> None:
         """Test that comments in .dat files are properly ignored."""
         # Arrange
         content = (
@@ -374,16 +394,15 @@ class TestEntryRepository:
             "  * Assets:Checking\n"
             "\n"
         )
-        mock_file = mock_open(read_data=content)
+        (tmp_path / "se-2024-03.dat").write_text(content)
 
         # Act
-        with patch("builtins.open", mock_file):
-            entries = repository_se.read_entries("se-2024-03.dat")
+        entries = repository_se.read_entries(str(tmp_path / "se-2024-03.dat"))
 
         # Assert
         assert len(entries) == 2
         # First entry
-        assert entries[0].entry_date == date(2024, 3, 21)
+        assert entries[0].entry_date == _ENTRY_DATE
         assert entries[0].category == "Shopping"
         assert len(entries[0].lines) == 2
         assert entries[0].lines[0].amount == 100
@@ -412,12 +431,9 @@ class TestEntryRepository:
             "  * Assets:Checking\n"
             "\n"
         )
-        mock_file = mock_open(read_data=file_content)
 
         # Act
-        with patch("builtins.open", mock_file):
-            with patch("os.path.exists", return_value=True):
-                entries = repository_se.read_entries("se-2024-03.dat")
+        entries = repository_se._parse_content(file_content)
 
         # Assert
         assert len(entries) == 1
@@ -440,12 +456,9 @@ class TestEntryRepository:
             "  Income:Salary:Monthly\n"
             "\n"
         )
-        mock_file = mock_open(read_data=file_content)
 
         # Act
-        with patch("builtins.open", mock_file):
-            with patch("os.path.exists", return_value=True):
-                entries = repository_es.read_entries("es-2024-03.dat")
+        entries = repository_es._parse_content(file_content)
 
         # Assert
         assert len(entries) == 1
@@ -458,19 +471,10 @@ class TestEntryRepository:
     def test_read_entry_with_no_comments(self, repository_se: EntryRepository) -> None:
         """Test reading an entry without any comments."""
         # Arrange
-        file_content = (
-            "2024/03/21 Shopping\n"
-            "  Shopping:Food                          SEK 100\n"
-            "  Shopping:Clothes                       SEK 200\n"
-            "  * Assets:Checking\n"
-            "\n"
-        )
-        mock_file = mock_open(read_data=file_content)
+        file_content = _SHOPPING_EXPENSE
 
         # Act
-        with patch("builtins.open", mock_file):
-            with patch("os.path.exists", return_value=True):
-                entries = repository_se.read_entries("se-2024-03.dat")
+        entries = repository_se._parse_content(file_content)
 
         # Assert
         assert len(entries) == 1
@@ -480,11 +484,154 @@ class TestEntryRepository:
         assert entry.lines[0].comments == []
         assert entry.lines[1].comments == []
 
+    @pytest.mark.parametrize("header_date", ["2024x03x21", "2024/03/211", "2024-03-21"])
+    def test_read_entry_with_malformed_header_date(self, repository_se: EntryRepository, header_date: str) -> None:
+        """Test that a header date with other separators or an overlong field is rejected."""
+        with pytest.raises(ValueError, match="Invalid date format"):
+            repository_se._parse_content(_EXISTING_SHOPPING.replace("2024/03/21", header_date))
+
+    def test_save_entry_after_malformed_last_header_reads_whole_file(self, tmp_path: Path) -> None:
+        """Test that a last header the parser would reject is not taken as the date to append after."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        existing_content = _EXISTING_SHOPPING.replace("2024/03/21", "2024/03/011")
+        (tmp_path / "se-2024-03.dat").write_text(existing_content)
+        entry = Entry(
+            entry_date=_ENTRY_DATE,
+            category="Food",
+            entry_type=EntryType.EXPENSE,
+            currency="SEK",
+            lines=[EntryLine(amount=100, description="Food:Lunch")],
+        )
+
+        # Act
+        with pytest.raises(ValueError, match="Invalid date format"):
+            repository.save_entry(entry)
+
+        # Assert
+        assert (tmp_path / "se-2024-03.dat").read_text() == existing_content
+
+    @pytest.mark.parametrize("amount_str, amount", [("+100", 100), ("1_000", 1000), ("0100", 100)])
+    def test_read_entry_with_hand_edited_amount(
+        self, repository_se: EntryRepository, amount_str: str, amount: int
+    ) -> None:
+        """Test that hand edited amounts are read in every form int() accepts."""
+        # Arrange
+        file_content = _EXISTING_SHOPPING.replace("SEK 100", f"SEK {amount_str}")
+
+        # Act
+        entries = repository_se._parse_content(file_content)
+
+        # Assert
+        assert [line.amount for line in entries[0].lines] == [amount]
+
+    def test_read_entry_skips_line_with_invalid_amount(self, repository_se: EntryRepository) -> None:
+        """Test that a line whose amount is not a number is skipped."""
+        # Arrange
+        file_content = _EXISTING_SHOPPING.replace(
+            "  * Assets:Checking", "  Shopping:Clothes                       SEK 1O0\n  * Assets:Checking"
+        )
+
+        # Act
+        entries = repository_se._parse_content(file_content)
+
+        # Assert
+        assert [line.description for line in entries[0].lines] == ["Shopping:Food"]
+
+    def test_read_entries_reuses_parsed_blocks(self, repository_se: EntryRepository) -> None:
+        """Test that unchanged entry blocks are only parsed once across reads."""
+        # Arrange
+        file_content = (
+            "2024/03/20 Shopping\n"
+            "  Shopping:Food                          SEK 100\n"
+            "  * Assets:Checking\n"
+            "\n"
+        )
+        new_block = (
+            "2024/03/21 Transport\n"
+            "  Transport:Bus                          SEK 200\n"
+            "  * Assets:Checking\n"
+            "\n"
+        )
+
+        # Act
+        with patch.object(repository_se, "_parse_entry", wraps=repository_se._parse_entry) as parse_entry:
+            first_entries = repository_se._parse_content(file_content)
+            second_entries = repository_se._parse_content(file_content + new_block)
+
+        # Assert
+        assert parse_entry.call_count == 2
+        assert second_entries[0] == first_entries[0]
+        assert second_entries[1].category == "Transport"
+
+    def test_read_entries_returns_new_entries_for_cached_blocks(self, repository_se: EntryRepository) -> None:
+        """Test that modifying an entry that was read does not affect later reads of the same block."""
+        # Arrange
+        first_entries = repository_se._parse_content(_EXISTING_SHOPPING)
+
+        # Act
+        first_entries[0].lines.append(EntryLine(amount=5, description="Shopping:Ghost"))
+        first_entries[0].lines[0].comments.append("; Ghost comment")
+        second_entries = repository_se._parse_content(_EXISTING_SHOPPING)
+
+        # Assert
+        assert second_entries[0] is not first_entries[0]
+        assert repository_se.format_entry(second_entries[0]) == _EXISTING_SHOPPING
+
+    def test_read_entries_skips_unchanged_file(self, repository_se: EntryRepository, tmp_path: Path) -> None:
+        """Test that a file is only parsed again once it has changed since the last read."""
+        # Arrange
+        filepath = tmp_path / "se-2024-03.dat"
+        filepath.write_text(_EXISTING_SHOPPING)
+
+        # Act
+        with patch.object(repository_se, "_parse_content", wraps=repository_se._parse_content) as parse_content:
+            first_entries = repository_se.read_entries(str(filepath))
+            first_entries[0].lines.append(EntryLine(amount=5, description="Shopping:Ghost"))
+            first_entries.clear()
+            second_entries = repository_se.read_entries(str(filepath))
+            with open(filepath, "a") as f:
+                f.write(_SALARY_INCOME.replace("EUR", "SEK"))
+            third_entries = repository_se.read_entries(str(filepath))
+
+        # Assert
+        assert parse_content.call_count == 2
+        assert [entry.category for entry in second_entries] == ["Shopping"]
+        assert repository_se.format_entry(second_entries[0]) == _EXISTING_SHOPPING
+        assert [entry.category for entry in third_entries] == ["Shopping", "Salary"]
+
+    def test_save_entry_does_not_read_back_a_file_it_saved(self, tmp_path: Path) -> None:
+        """Test that saves after the first reuse the entries the repository itself wrote or appended."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        entries = [
+            Entry(
+                entry_date=date(2024, 3, day),
+                category="Food",
+                entry_type=EntryType.EXPENSE,
+                currency="SEK",
+                lines=[EntryLine(amount=100 * day, description="Food:Lunch")],
+            )
+            for day in (21, 25, 10, 3, 10)
+        ]
+
+        # Act
+        with patch.object(repository, "_parse_content", wraps=repository._parse_content) as parse_content:
+            for entry in entries:
+                repository.save_entry(entry)
+
+        # Assert
+        parse_content.assert_not_called()
+        expected_entries = [entries[3], repository.merge_entries(entries[2], entries[4]), entries[0], entries[1]]
+        expected_content = "".join(repository.format_entry(entry) for entry in expected_entries)
+        assert (tmp_path / "se-2024-03.dat").read_text() == expected_content
+        assert repository.read_entries(str(tmp_path / "se-2024-03.dat")) == expected_entries
+
     def test_format_entry_with_comments(self, repository_se: EntryRepository) -> None:
         """Test formatting an entry with both entry and line comments."""
         # Arrange
         entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Shopping",
             entry_type=EntryType.EXPENSE,
             currency="SEK",
@@ -520,7 +667,7 @@ class TestEntryRepository:
         """Test formatting an income entry with comments."""
         # Arrange
         entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Salary",
             entry_type=EntryType.INCOME,
             currency="EUR",
@@ -552,7 +699,7 @@ class TestEntryRepository:
         """Test formatting an entry without any comments."""
         # Arrange
         entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Shopping",
             entry_type=EntryType.EXPENSE,
             currency="SEK",
@@ -562,13 +709,7 @@ class TestEntryRepository:
             ],
         )
 
-        expected_output = (
-            "2024/03/21 Shopping\n"
-            "  Shopping:Food                          SEK 100\n"
-            "  Shopping:Clothes                       SEK 200\n"
-            "  * Assets:Checking\n"
-            "\n"
-        )
+        expected_output = _SHOPPING_EXPENSE
 
         # Act
         result = repository_se.format_entry(entry)
@@ -576,11 +717,11 @@ class TestEntryRepository:
         # Assert
         assert result == expected_output
 
-    def test_save_entry_preserves_comments(self, repository_se: EntryRepository) -> None:
+    def test_save_entry_preserves_comments(self, tmp_path: Path) -> None:
         """Test that saving an entry preserves all comments."""
         # Arrange
         entry = Entry(
-            entry_date=date(2024, 3, 21),
+            entry_date=_ENTRY_DATE,
             category="Shopping",
             entry_type=EntryType.EXPENSE,
             currency="SEK",
@@ -598,13 +739,298 @@ class TestEntryRepository:
             "  * Assets:Checking\n"
             "\n"
         )
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+
+        # Act
+        repository.save_entry(entry)
+
+        # Assert
+        assert (tmp_path / "se-2024-03.dat").read_text() == expected_content
+
+    @pytest.mark.parametrize(
+        "ending",
+        ["\n", ""],
+        ids=["single-newline", "no-trailing-newline"],
+    )
+    def test_save_entry_appends_same_date_entry_after_unterminated_file(self, tmp_path: Path, ending: str) -> None:
+        """Test that an entry appended to a hand edited file missing the final blank line stays separate."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        (tmp_path / "se-2024-03.dat").write_text(_EXISTING_SHOPPING.rstrip("\n") + ending)
+        new_entry = Entry(
+            entry_date=_ENTRY_DATE,
+            category="Bills",
+            entry_type=EntryType.EXPENSE,
+            currency="SEK",
+            lines=[EntryLine(amount=5, description="Bills:Power")],
+        )
+
+        # Act
+        repository.save_entry(new_entry)
+
+        # Assert
+        entries = repository.read_entries(str(tmp_path / "se-2024-03.dat"))
+        assert [entry.category for entry in entries] == ["Shopping", "Bills"]
+        assert [len(entry.lines) for entry in entries] == [1, 1]
+
+    @pytest.mark.parametrize(
+        "ending, separator",
+        [("\n\n", ""), ("\n", "\n"), ("", "\n\n")],
+        ids=["blank-line", "single-newline", "no-trailing-newline"],
+    )
+    def test_save_entry_appends_later_entry_after_any_file_ending(
+        self, tmp_path: Path, ending: str, separator: str
+    ) -> None:
+        """Test that the tail read fast path completes a missing final blank line before appending."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        existing_content = _EXISTING_SHOPPING.rstrip("\n") + ending
+        (tmp_path / "se-2024-03.dat").write_text(existing_content)
+        new_entry = Entry(
+            entry_date=date(2024, 3, 22),
+            category="Bills",
+            entry_type=EntryType.EXPENSE,
+            currency="SEK",
+            lines=[EntryLine(amount=5, description="Bills:Power")],
+        )
+
+        # Act
+        with patch.object(repository, "read_entries") as read_entries:
+            repository.save_entry(new_entry)
+
+        # Assert
+        read_entries.assert_not_called()
+        expected_content = existing_content + separator + repository.format_entry(new_entry)
+        assert (tmp_path / "se-2024-03.dat").read_text() == expected_content
+
+    def test_save_entry_appends_entry_that_sorts_last(self, tmp_path: Path) -> None:
+        """Test that an entry dated after every existing one is appended to the file."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        existing_content = (
+            "2024/03/20 Shopping\n"
+            "  Shopping:Food                          SEK 100\n"
+            "  * Assets:Checking\n"
+            "\n"
+        )
+        (tmp_path / "se-2024-03.dat").write_text(existing_content)
+        new_entry = Entry(
+            entry_date=date(2024, 3, 22),
+            category="Transport",
+            entry_type=EntryType.EXPENSE,
+            currency="SEK",
+            lines=[EntryLine(amount=200, description="Transport:Bus")],
+        )
+
+        # Act
+        repository.save_entry(new_entry)
 
-        mock_file = mock_open()
+        # Assert
+        expected_content = existing_content + repository.format_entry(new_entry)
+        assert (tmp_path / "se-2024-03.dat").read_text() == expected_content
+
+    def test_save_entry_appends_later_entry_without_reading_whole_file(self, tmp_path: Path) -> None:
+        """Test that an entry dated after the last one is appended after only reading the end of the file."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        existing_entries = [
+            Entry(
+                entry_date=date(2024, 3, day),
+                category="Food",
+                entry_type=EntryType.EXPENSE,
+                currency="SEK",
+                lines=[EntryLine(amount=amount, description="Food:Lunch") for amount in range(20)],
+            )
+            for day in range(1, 21)
+        ]
+        existing_content = "".join(repository.format_entry(entry) for entry in existing_entries)
+        assert len(existing_content) > 4096
+        (tmp_path / "se-2024-03.dat").write_text(existing_content)
+        new_entry = Entry(
+            entry_date=_ENTRY_DATE,
+            category="Food",
+            entry_type=EntryType.EXPENSE,
+            currency="SEK",
+            lines=[EntryLine(amount=200, description="Food:Dinner")],
+        )
 
         # Act
-        with patch("builtins.open", mock_file):
-            with patch("os.path.exists", return_value=False):
-                repository_se.save_entry(entry)
+        with patch.object(repository, "read_entries") as read_entries:
+            repository.save_entry(new_entry)
 
         # Assert
-        mock_file().write.assert_called_once_with(expected_content)
+        read_entries.assert_not_called()
+        expected_content = existing_content + repository.format_entry(new_entry)
+        assert (tmp_path / "se-2024-03.dat").read_text() == expected_content
+
+    def test_save_entry_rewrite_leaves_no_temporary_file(self, tmp_path: Path) -> None:
+        """Test that rewriting a file replaces it with the temporary file it was written to."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        existing_content = (
+            "2024/03/22 Shopping\n"
+            "  Shopping:Food                          SEK 100\n"
+            "  * Assets:Checking\n"
+            "\n"
+        )
+        (tmp_path / "se-2024-03.dat").write_text(existing_content)
+        new_entry = Entry(
+            entry_date=date(2024, 3, 20),
+            category="Transport",
+            entry_type=EntryType.EXPENSE,
+            currency="SEK",
+            lines=[EntryLine(amount=200, description="Transport:Bus")],
+        )
+
+        # Act
+        repository.save_entry(new_entry)
+
+        # Assert
+        expected_content = repository.format_entry(new_entry) + existing_content
+        assert (tmp_path / "se-2024-03.dat").read_text() == expected_content
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["se-2024-03.dat"]
+
+    def test_session_writes_each_file_once_on_exit(self, tmp_path: Path) -> None:
+        """Test that entries saved in a session are written once, when the session ends."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        entries = [
+            Entry(
+                entry_date=date(2024, 3, day),
+                category="Food",
+                entry_type=EntryType.EXPENSE,
+                currency="SEK",
+                lines=[EntryLine(amount=100 * day, description="Food:Lunch")],
+            )
+            for day in (22, 20, 21, 20)
+        ]
+        filepath = tmp_path / "se-2024-03.dat"
+
+        # Act
+        with patch.object(repository, "_write_entries", wraps=repository._write_entries) as write_entries:
+            with repository.session():
+                for entry in entries:
+                    repository.save_entry(entry)
+                assert not filepath.exists()
+
+        # Assert
+        write_entries.assert_called_once()
+        assert filepath.read_text() == (
+            "2024/03/20 Food\n"
+            "  Food:Lunch                             SEK 2000\n"
+            "  Food:Lunch                             SEK 2000\n"
+            "  * Assets:Checking\n"
+            "\n"
+            "2024/03/21 Food\n"
+            "  Food:Lunch                             SEK 2100\n"
+            "  * Assets:Checking\n"
+            "\n"
+            "2024/03/22 Food\n"
+            "  Food:Lunch                             SEK 2200\n"
+            "  * Assets:Checking\n"
+            "\n"
+        )
+
+    def test_session_left_by_an_exception_writes_nothing(self, tmp_path: Path) -> None:
+        """Test that entries saved in a session that raises are discarded instead of written."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        filepath = tmp_path / "se-2024-03.dat"
+        filepath.write_text(_EXISTING_SHOPPING)
+        entry = Entry(
+            entry_date=date(2024, 3, 20),
+            category="Food",
+            entry_type=EntryType.EXPENSE,
+            currency="SEK",
+            lines=[EntryLine(amount=100, description="Food:Lunch")],
+        )
+
+        # Act
+        with pytest.raises(RuntimeError, match="import failed"):
+            with repository.session():
+                repository.save_entry(entry)
+                raise RuntimeError("import failed")
+        with repository.session():
+            pass
+
+        # Assert
+        assert filepath.read_text() == _EXISTING_SHOPPING
+
+    def test_session_writes_entries_as_they_were_saved(self, tmp_path: Path) -> None:
+        """Test that changing an entry after saving it in a session does not change what is written."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        entry, other_month_entry = (
+            Entry(
+                entry_date=entry_date,
+                category="Food",
+                entry_type=EntryType.EXPENSE,
+                currency="SEK",
+                lines=[EntryLine(amount=100, description="Food:Lunch")],
+            )
+            for entry_date in (_ENTRY_DATE, date(2024, 4, 2))
+        )
+        expected_content = repository.format_entry(entry)
+
+        # Act
+        with repository.session():
+            repository.save_entry(entry)
+            repository.save_entries([other_month_entry])
+            for saved_entry in (entry, other_month_entry):
+                saved_entry.lines[0].amount = 999
+                saved_entry.lines.append(EntryLine(amount=5, description="Food:Ghost"))
+
+        # Assert
+        assert (tmp_path / "se-2024-03.dat").read_text() == expected_content
+        assert (tmp_path / "se-2024-04.dat").read_text() == expected_content.replace("03/21", "04/02")
+
+    def test_session_still_works_after_a_failed_flush(self, tmp_path: Path) -> None:
+        """Test that a write failing when a session ends does not break later sessions."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        march_entry, april_entry = (
+            Entry(
+                entry_date=entry_date,
+                category="Food",
+                entry_type=EntryType.EXPENSE,
+                currency="SEK",
+                lines=[EntryLine(amount=100, description="Food:Lunch")],
+            )
+            for entry_date in (_ENTRY_DATE, date(2024, 4, 2))
+        )
+
+        # Act
+        with patch.object(repository, "_write_entries", side_effect=[OSError("disk full"), None]):
+            with pytest.raises(OSError, match="disk full"):
+                with repository.session():
+                    repository.save_entry(march_entry)
+                    repository.save_entry(april_entry)
+        with repository.session():
+            repository.save_entry(march_entry)
+
+        # Assert
+        assert (tmp_path / "se-2024-03.dat").read_text() == repository.format_entry(march_entry)
+
+    def test_save_entries_writes_each_month_to_its_own_file(self, tmp_path: Path) -> None:
+        """Test that entries spanning several months are split into one file per month."""
+        # Arrange
+        repository = EntryRepository(data_dir=str(tmp_path), country_code="se")
+        march_entry, april_entry, earlier_march_entry = (
+            Entry(
+                entry_date=entry_date,
+                category="Food",
+                entry_type=EntryType.EXPENSE,
+                currency="SEK",
+                lines=[EntryLine(amount=100, description="Food:Lunch")],
+            )
+            for entry_date in (_ENTRY_DATE, date(2024, 4, 2), date(2024, 3, 20))
+        )
+
+        # Act
+        repository.save_entries([march_entry, april_entry, earlier_march_entry])
+
+        # Assert
+        assert (tmp_path / "se-2024-03.dat").read_text() == (
+            repository.format_entry(earlier_march_entry) + repository.format_entry(march_entry)
+        )
+        assert (tmp_path / "se-2024-04.dat").read_text() == repository.format_entry(april_entry)